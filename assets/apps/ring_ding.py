@@ -6,11 +6,24 @@ Simple rewrite with correct coordinate handling
 
 import pygame
 import numpy as np
-import math
 import sys
 import os
+import queue
+import threading
 from enum import Enum
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the hot path still runs as plain Python"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # Game constants
 NUM_LEVELS = 20
 INITIAL_TARGET_ARC = 90  # degrees
@@ -33,6 +46,27 @@ COLOR_TEXT = (200, 200, 200)
 # Audio constants
 SAMPLE_RATE = 22050
 
+# Synthesized sounds, reused across SoundSynth/RingDingGame instances
+_SOUND_CACHE: dict[tuple, pygame.mixer.Sound] = {}
+
+
+@njit(cache=True)
+def _in_zone(marker, target_start, target_end, wraps):
+    """Angle range check against precomputed, wrapped hit zone bounds"""
+    if not wraps:
+        return target_start <= marker <= target_end
+    return marker >= target_start or marker <= target_end
+
+
+@njit(cache=True)
+def _update_core(marker_angle, rotation_speed, target_start, target_end, wraps, was_in_target):
+    """Advance the marker one frame. Returns (marker_angle, in_target, exited_target)"""
+    marker_angle += rotation_speed
+    if marker_angle >= 360:
+        marker_angle -= 360
+    in_target = _in_zone(marker_angle, target_start, target_end, wraps)
+    return marker_angle, in_target, was_in_target and not in_target
+
 
 class GameState(Enum):
     IDLE = 0
@@ -42,40 +76,61 @@ class GameState(Enum):
 
 
 class SoundSynth:
-    """Synthesize simple sound effects"""
+    """Synthesize simple sound effects (float32 pipeline, int16 output)"""
 
     def __init__(self, sample_rate=SAMPLE_RATE):
         self.sample_rate = sample_rate
+        # Mono mixer: sound buffers are plain 1-D int16 arrays
         pygame.mixer.init(frequency=sample_rate, size=-16, channels=1, buffer=1024)
+        # 10ms fade in/out ramps, applied in place to each wave's ends
+        self._fade_samples = int(0.01 * sample_rate)
+        self._fade_in = np.linspace(0, 1, self._fade_samples, dtype=np.float32)
+        self._fade_out = self._fade_in[::-1]
+        self._t_cache: dict[int, np.ndarray] = {}  # num_samples -> time base (s)
+
+    def _time_base(self, num_samples):
+        """Shared read-only time array for a given sample count"""
+        t = self._t_cache.get(num_samples)
+        if t is None:
+            t = np.arange(num_samples, dtype=np.float32) / np.float32(self.sample_rate)
+            self._t_cache[num_samples] = t
+        return t
+
+    def _apply_envelope(self, wave, volume):
+        """Fade in/out and scale a float32 wave in place"""
+        wave[:self._fade_samples] *= self._fade_in
+        wave[-self._fade_samples:] *= self._fade_out
+        if volume != 1:
+            wave *= volume
 
     def generate_tone(self, frequency, duration, volume=1):
-        num_samples = int(duration * self.sample_rate)
-        t = np.linspace(0, duration, num_samples)
-        wave = np.sin(2 * np.pi * frequency * t)
-        envelope = np.ones(num_samples)
-        fade_samples = int(0.01 * self.sample_rate)
-        envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
-        envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
-        wave = wave * envelope * volume
+        key = ((frequency,), duration, volume, self.sample_rate)
+        if key in _SOUND_CACHE:
+            return _SOUND_CACHE[key]
+        t = self._time_base(int(duration * self.sample_rate))
+        wave = np.sin(np.float32(2 * np.pi * frequency) * t)
+        self._apply_envelope(wave, volume)
         wave = (wave * 32767).astype(np.int16)
-        stereo_wave = np.column_stack((wave, wave))
-        return pygame.sndarray.make_sound(stereo_wave)
+        _SOUND_CACHE[key] = pygame.sndarray.make_sound(wave)
+        return _SOUND_CACHE[key]
+
+    def _gen_chord_float(self, frequencies, duration, volume=1):
+        """Synthesize a chord as a float32 wave in [-1, 1], before int16 conversion"""
+        t = self._time_base(int(duration * self.sample_rate))
+        # All harmonics in one broadcasted (K, N) sin evaluation
+        freqs = np.asarray(frequencies, dtype=np.float32).reshape(-1, 1)
+        wave = np.sin(np.float32(2 * np.pi) * freqs * t).sum(axis=0) / len(frequencies)
+        self._apply_envelope(wave, volume)
+        return wave
 
     def generate_chord(self, frequencies, duration, volume=1):
-        num_samples = int(duration * self.sample_rate)
-        t = np.linspace(0, duration, num_samples)
-        wave = np.zeros(num_samples)
-        for freq in frequencies:
-            wave += np.sin(2 * np.pi * freq * t)
-        wave = wave / len(frequencies)
-        envelope = np.ones(num_samples)
-        fade_samples = int(0.01 * self.sample_rate)
-        envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
-        envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
-        wave = wave * envelope * volume
+        key = (tuple(frequencies), duration, volume, self.sample_rate)
+        if key in _SOUND_CACHE:
+            return _SOUND_CACHE[key]
+        wave = self._gen_chord_float(frequencies, duration, volume)
         wave = (wave * 32767).astype(np.int16)
-        stereo_wave = np.column_stack((wave, wave))
-        return pygame.sndarray.make_sound(stereo_wave)
+        _SOUND_CACHE[key] = pygame.sndarray.make_sound(wave)
+        return _SOUND_CACHE[key]
 
     def ding(self):
         return self.generate_chord([523, 659, 784], 0.3, volume=1)
@@ -84,44 +139,28 @@ class SoundSynth:
         return self.generate_chord([523, 659, 784, 1047], 0.6, volume=1)
 
     def lose_sound(self):
-        # Classic Mac crash sound - 3 descending chords using generate_chord
-        duration = 0.82  # 820ms total (200ms + 10ms + 200ms + 10ms + 400ms)
-        num_samples = int(duration * self.sample_rate)
-        wave = np.zeros(num_samples)
-
-        # First chord: Minor 2nd cluster (C-C#-D) - 200ms - very dissonant crash sound
-        chord1 = self.generate_chord([523.25, 554.37, 587.33], 0.2, volume=1.0)
-        chord1_array = pygame.sndarray.array(chord1)
-        # Convert from int16 to float, normalize, then back to int16
-        chord1_float = chord1_array[:, 0].astype(np.float32) / 32767.0
-        wave[:len(chord1_float)] = chord1_float
-
-        # Gap 1: 10ms silence
-        gap1_start = len(chord1_float)
-        gap1_samples = int(0.01 * self.sample_rate)
-
-        # Second chord: A minor (A-C-E) - 200ms
-        chord2 = self.generate_chord([440.00, 523.25, 659.25], 0.2, volume=1.0)
-        chord2_array = pygame.sndarray.array(chord2)
-        chord2_float = chord2_array[:, 0].astype(np.float32) / 32767.0
-        chord2_start = gap1_start + gap1_samples
-        wave[chord2_start:chord2_start + len(chord2_float)] = chord2_float
-
-        # Gap 2: 10ms silence
-        gap2_start = chord2_start + len(chord2_float)
-        gap2_samples = int(0.01 * self.sample_rate)
-
-        # Third chord: F major (F-A-C) - 400ms
-        chord3 = self.generate_chord([349.23, 440.00, 523.25], 0.4, volume=1.0)
-        chord3_array = pygame.sndarray.array(chord3)
-        chord3_float = chord3_array[:, 0].astype(np.float32) / 32767.0
-        chord3_start = gap2_start + gap2_samples
-        wave[chord3_start:chord3_start + len(chord3_float)] = chord3_float
-
-        # Convert back to pygame sound
+        # Classic Mac crash sound - 3 descending chords spliced as float waves
+        key = ("lose", self.sample_rate)
+        if key in _SOUND_CACHE:
+            return _SOUND_CACHE[key]
+        gap = np.zeros(int(0.01 * self.sample_rate), dtype=np.float32)  # 10ms silence
+
+        # 820ms total (200ms + 10ms + 200ms + 10ms + 400ms), built in one concatenate pass
+        wave = np.concatenate([
+            # First chord: Minor 2nd cluster (C-C#-D) - 200ms - very dissonant crash sound
+            self._gen_chord_float([523.25, 554.37, 587.33], 0.2, volume=1.0),
+            gap,
+            # Second chord: A minor (A-C-E) - 200ms
+            self._gen_chord_float([440.00, 523.25, 659.25], 0.2, volume=1.0),
+            gap,
+            # Third chord: F major (F-A-C) - 400ms
+            self._gen_chord_float([349.23, 440.00, 523.25], 0.4, volume=1.0),
+        ])
+
+        # Convert to pygame sound
         wave = (wave * 32767).astype(np.int16)
-        stereo_wave = np.column_stack((wave, wave))
-        return pygame.sndarray.make_sound(stereo_wave)
+        _SOUND_CACHE[key] = pygame.sndarray.make_sound(wave)
+        return _SOUND_CACHE[key]
 
 
 class RingDingGame:
@@ -137,6 +176,20 @@ class RingDingGame:
 
         self.screen = pygame.display.set_mode((width, height), pygame.NOFRAME)
         pygame.display.set_caption("Ring Ding")
+        # Only quit/key events matter; keep mouse motion etc. out of the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+        self._left_surf = pygame.Surface((self.half_width, height))
+
+        # Dirty-rect tracking: full flip when (state, level) changes, otherwise only
+        # push the marker and text areas that can change between frames
+        self._last_frame_key = None
+        self._prev_dirty = []
+        self._text_rects = []
+        for x_offset in [self.half_width // 2, self.half_width + self.half_width // 2]:
+            text_rect = pygame.Rect(0, 0, 320, 180)  # Fits inside the track's inner disc
+            text_rect.center = (x_offset, height // 2)
+            self._text_rects.append(text_rect)
 
         self.clock = pygame.time.Clock()
         self.fps = 60
@@ -148,9 +201,32 @@ class RingDingGame:
             'lose': self.synth.lose_sound()
         }
 
+        # Sounds are dispatched from a dedicated thread so mixer calls never stall a frame
+        self._sound_queue = queue.Queue()
+        threading.Thread(target=self._sound_worker, daemon=True).start()
+
         self.font_large = pygame.font.Font(None, 72)
         self.font_medium = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 36)
+        self._text_cache = {}  # (id(font), text, color) -> rendered Surface
+
+        # Static menus: surfaces and positions on both displays laid out once
+        self._idle_blits = self._layout_menu([
+            (self.font_large, "RING DING", COLOR_TEXT, -180),
+            (self.font_small, "20 levels - Press A when green hits red zone", COLOR_TEXT, -100),
+            (self.font_small, "Press outside zone = Game Over | Let it loop = -1 pt", COLOR_TEXT, -65),
+            (self.font_medium, "Press A to start", COLOR_TEXT, 20),
+            (self.font_small, "Original ESP32 LED game by", COLOR_TEXT, 160),
+            (self.font_small, "Miggy and Dharsi", COLOR_TEXT, 195),
+            (self.font_small, "Score system by Azavech", COLOR_TEXT, 230),
+            (self.font_small, "Ported to Pygame by lululombard", COLOR_TEXT, 265),
+        ])
+        self._lose_blits = self._layout_menu([
+            (self.font_large, "GAME OVER", COLOR_BG, -50),
+            (self.font_small, "Press A to try again", COLOR_BG, 50),
+            (self.font_small, "Press B for menu", COLOR_BG, 90),
+        ])
+        self._win_blits = []  # Laid out on win, since it shows the final score
 
         self.state = GameState.IDLE
         self.current_level = 0
@@ -158,6 +234,10 @@ class RingDingGame:
         self.marker_angle = 0.0  # 0-360, internal angle
         self.target_start_angle = 0.0
         self.target_arc_size = 0.0
+        self._tgt_start_mod = 0.0  # Hit zone bounds incl. margin, wrapped to 0-360
+        self._tgt_end_mod = 0.0
+        self._tgt_wraps = False  # Hit zone crosses 0°
+        self._arc_surf = None  # Target arc pre-rendered once per level
         self.rotation_speed = ROTATION_SPEED
         self.state_timer = 0
         self.was_in_target = False  # Track if marker was in target zone last frame
@@ -167,6 +247,18 @@ class RingDingGame:
         self.feedback_color = None  # Color of feedback
         self.feedback_alpha = 0  # Alpha for fade effect
 
+        # Half-degree sin/cos lookup tables for drawing (index = round(angle * 2) % 720)
+        lut_angles = np.deg2rad(np.arange(720, dtype=np.float32) * 0.5)
+        self._cos = np.cos(lut_angles)
+        self._sin = np.sin(lut_angles)
+
+    def _sound_worker(self):
+        while True:
+            self._sound_queue.get().play()
+
+    def play_sound(self, name):
+        self._sound_queue.put(self.sounds[name])
+
     def start_game(self):
         self.state = GameState.PLAYING
         self.current_level = 1
@@ -186,21 +278,22 @@ class RingDingGame:
         self.target_arc_size = INITIAL_TARGET_ARC - (INITIAL_TARGET_ARC - FINAL_TARGET_ARC) * progress
         max_angle = 360 - self.target_arc_size
         self.target_start_angle = np.random.uniform(0, max_angle)
+        self._tgt_start_mod = (self.target_start_angle - HIT_MARGIN) % 360
+        self._tgt_end_mod = (self.target_start_angle + self.target_arc_size + HIT_MARGIN) % 360
+        self._tgt_wraps = self._tgt_start_mod > self._tgt_end_mod
+        self._render_target_arc()
         self.was_in_target = False
         self.validated_this_pass = False
         self.pass_count = 0
         print(f"[RingDing] Level {self.current_level}: Target={self.target_start_angle:.1f}° size={self.target_arc_size:.1f}°")
 
     def check_hit(self, verbose=False):
-        """Simple angle range check"""
-        marker = self.marker_angle % 360
-        target_start = (self.target_start_angle - HIT_MARGIN) % 360
-        target_end = (self.target_start_angle + self.target_arc_size + HIT_MARGIN) % 360
+        """Simple angle range check (marker_angle is kept within 0-360 by update)"""
+        marker = self.marker_angle
+        target_start = self._tgt_start_mod
+        target_end = self._tgt_end_mod
 
-        if target_start <= target_end:
-            in_zone = target_start <= marker <= target_end
-        else:
-            in_zone = marker >= target_start or marker <= target_end
+        in_zone = _in_zone(marker, target_start, target_end, self._tgt_wraps)
 
         if verbose:
             print(f"[RingDing] Hit: M={marker:.0f}° T={target_start:.0f}°-{target_end:.0f}° = {in_zone}")
@@ -220,10 +313,16 @@ class RingDingGame:
             if self.current_level >= NUM_LEVELS:
                 self.state = GameState.WIN
                 self.state_timer = 0
-                self.sounds['win'].play()
+                self._win_blits = self._layout_menu([
+                    (self.font_large, "YOU WIN!", COLOR_BG, -70),
+                    (self.font_medium, f"Score: {self.score} / {NUM_LEVELS * 10}", COLOR_BG, 0),
+                    (self.font_small, "Press A to play again", COLOR_BG, 70),
+                    (self.font_small, "Press B for menu", COLOR_BG, 110),
+                ])
+                self.play_sound('win')
                 print("[RingDing] GAME WON!")
             else:
-                self.sounds['ding'].play()
+                self.play_sound('ding')
                 self.current_level += 1
                 self.feedback_text = "+10"
                 self.feedback_color = COLOR_WIN
@@ -233,19 +332,17 @@ class RingDingGame:
         else:
             self.state = GameState.LOSE
             self.state_timer = 0
-            self.sounds['lose'].play()
+            self.play_sound('lose')
             print("[RingDing] GAME LOST!")
 
     def update(self):
         if self.state == GameState.PLAYING:
-            self.marker_angle += self.rotation_speed
-            self.marker_angle %= 360
-
-            # Check if marker is currently in target zone
-            in_target = self.check_hit()
+            # Move marker, check if it is in the target zone and detect when it exits
+            self.marker_angle, in_target, exited = _update_core(
+                self.marker_angle, self.rotation_speed,
+                self._tgt_start_mod, self._tgt_end_mod, self._tgt_wraps, self.was_in_target)
 
-            # Detect when marker exits target zone
-            if self.was_in_target and not in_target:
+            if exited:
                 self.pass_count += 1
                 # Skip first pass, don't penalize
                 if self.pass_count > 1 and not self.validated_this_pass:
@@ -265,131 +362,130 @@ class RingDingGame:
         elif self.state in [GameState.WIN, GameState.LOSE]:
             self.state_timer += 1
 
+    def _layout_menu(self, lines):
+        """Render (font, text, color, y_offset) lines centered on both displays.
+        Returns (surface, rect) pairs ready to blit"""
+        blits = []
+        for x_offset in [self.half_width // 2, self.half_width + self.half_width // 2]:
+            for font, text, color, y_offset in lines:
+                surf = self._render(font, text, color)
+                blits.append((surf, surf.get_rect(center=(x_offset, self.height // 2 + y_offset))))
+        return blits
+
+    def _render(self, font, text, color):
+        """Render text once and reuse the surface on later frames"""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+        return surf
+
     def draw_arc_segment(self, surface, center_x, center_y, radius, start_angle_deg, end_angle_deg, color, width):
-        """Draw arc using overlapping circles for smooth appearance"""
+        """Draw arc as a single filled band polygon with rounded end caps"""
         arc_length = abs(end_angle_deg - start_angle_deg)
         num_points = max(int(arc_length * 3), 10)  # 3 points per degree for smooth arcs
 
-        for i in range(num_points + 1):
-            t = i / num_points
-            angle = start_angle_deg + t * (end_angle_deg - start_angle_deg)
-
-            x = center_x + radius * math.cos(math.radians(angle))
-            y = center_y + radius * math.sin(math.radians(angle))
-
-            # Draw a circle at this point for smooth coverage
-            pygame.draw.circle(surface, color, (int(x), int(y)), width // 2)
-
-    def draw_circle_display(self, surface, center_x, center_y, mirror=False):
-        """Draw game on one display. mirror=True flips to counter-clockwise"""
+        # One vectorized trig pass (arc is only built once per level, so no LUT snapping)
+        rads = np.deg2rad(np.linspace(start_angle_deg, end_angle_deg, num_points + 1))
+        cos, sin = np.cos(rads), np.sin(rads)
+
+        # Outer edge forward, inner edge backward
+        half = width / 2
+        radii = np.concatenate((np.full(num_points + 1, radius + half), np.full(num_points + 1, radius - half)))
+        vertices = np.empty((2 * (num_points + 1), 2))
+        vertices[:, 0] = center_x + radii * np.concatenate((cos, cos[::-1]))
+        vertices[:, 1] = center_y + radii * np.concatenate((sin, sin[::-1]))
+        pygame.draw.polygon(surface, color, vertices.tolist())
+
+        # Round caps, matching the previous overlapping-circles look
+        for i in (0, -1):
+            cap = (int(center_x + radius * cos[i]), int(center_y + radius * sin[i]))
+            pygame.draw.circle(surface, color, cap, width // 2)
+
+    def _render_target_arc(self):
+        """Draw the stationary target arc once onto a transparent surface centered on the ring"""
+        r = CIRCLE_RADIUS + TRACK_WIDTH
+        self._arc_surf = pygame.Surface((2 * r, 2 * r), pygame.SRCALPHA)
+        self.draw_arc_segment(self._arc_surf, r, r, CIRCLE_RADIUS,
+                            self.target_start_angle, self.target_start_angle + self.target_arc_size,
+                            COLOR_TARGET, TRACK_WIDTH + 10)
+
+    def draw_circle_display(self, surface, center_x, center_y):
+        """Draw track, target and marker for the left display (clockwise due to Y-down).
+        Returns the marker's bounding rect while playing, None otherwise"""
         # Draw track
         pygame.draw.circle(surface, COLOR_TRACK, (center_x, center_y), CIRCLE_RADIUS, TRACK_WIDTH)
 
         if self.state == GameState.PLAYING:
-            # Calculate visual angles (mirror inverts direction)
-            if mirror:
-                # Right display: flip and add 180° offset
-                visual_target_start = -(self.target_start_angle + 180)
-                visual_target_end = -(self.target_start_angle + self.target_arc_size + 180)
-                visual_marker = -(self.marker_angle + 180)
-            else:
-                # Left display: use raw angles (appears clockwise due to Y-down)
-                visual_target_start = self.target_start_angle
-                visual_target_end = self.target_start_angle + self.target_arc_size
-                visual_marker = self.marker_angle
-
             # Draw target arc
-            self.draw_arc_segment(surface, center_x, center_y, CIRCLE_RADIUS,
-                                visual_target_start, visual_target_end, COLOR_TARGET, TRACK_WIDTH + 10)
+            r = CIRCLE_RADIUS + TRACK_WIDTH
+            surface.blit(self._arc_surf, (center_x - r, center_y - r))
 
             # Draw marker
-            marker_x = center_x + CIRCLE_RADIUS * math.cos(math.radians(visual_marker))
-            marker_y = center_y + CIRCLE_RADIUS * math.sin(math.radians(visual_marker))
-            pygame.draw.circle(surface, COLOR_MARKER, (int(marker_x), int(marker_y)), MARKER_SIZE // 2)
-
-            # Level text
-            level_text = self.font_medium.render(f"Level {self.current_level}", True, COLOR_TEXT)
-            score_text = self.font_medium.render(f"Score {self.score}", True, COLOR_TEXT)
-            text_rect = level_text.get_rect(center=(center_x, center_y - 25))
-            surface.blit(level_text, text_rect)
-            score_rect = score_text.get_rect(center=(center_x, center_y + 25))
-            surface.blit(score_text, score_rect)
-
-            # Feedback text with fade
-            if self.feedback_text and self.feedback_alpha > 0:
-                feedback_surface = self.font_small.render(self.feedback_text, True, self.feedback_color)
-                feedback_surface.set_alpha(self.feedback_alpha)
-                feedback_rect = feedback_surface.get_rect(center=(center_x, center_y + 65))
-                surface.blit(feedback_surface, feedback_rect)
+            marker_idx = int(round(self.marker_angle * 2)) % 720
+            marker_x = center_x + CIRCLE_RADIUS * self._cos[marker_idx]
+            marker_y = center_y + CIRCLE_RADIUS * self._sin[marker_idx]
+            return pygame.draw.circle(surface, COLOR_MARKER, (int(marker_x), int(marker_y)), MARKER_SIZE // 2)
+        return None
+
+    def draw_circle_text(self, surface, center_x, center_y):
+        """Draw level, score and feedback text (not mirrored, so drawn per display)"""
+        # Level text
+        level_text = self._render(self.font_medium, f"Level {self.current_level}", COLOR_TEXT)
+        score_text = self._render(self.font_medium, f"Score {self.score}", COLOR_TEXT)
+        text_rect = level_text.get_rect(center=(center_x, center_y - 25))
+        surface.blit(level_text, text_rect)
+        score_rect = score_text.get_rect(center=(center_x, center_y + 25))
+        surface.blit(score_text, score_rect)
+
+        # Feedback text with fade
+        if self.feedback_text and self.feedback_alpha > 0:
+            feedback_surface = self._render(self.font_small, self.feedback_text, self.feedback_color)
+            feedback_surface.set_alpha(self.feedback_alpha)
+            feedback_rect = feedback_surface.get_rect(center=(center_x, center_y + 65))
+            surface.blit(feedback_surface, feedback_rect)
 
     def draw(self):
         self.screen.fill(COLOR_BG)
+        dirty = []  # Menus are static, nothing to push after their first frame
 
         if self.state == GameState.IDLE:
-            title = self.font_large.render("RING DING", True, COLOR_TEXT)
-            rule_text_1 = self.font_small.render("20 levels - Press A when green hits red zone", True, COLOR_TEXT)
-            rule_text_2 = self.font_small.render("Press outside zone = Game Over | Let it loop = -1 pt", True, COLOR_TEXT)
-            start_text = self.font_medium.render("Press A to start", True, COLOR_TEXT)
-            credit_text_1 = self.font_small.render("Original ESP32 LED game by", True, COLOR_TEXT)
-            credit_text_2 = self.font_small.render("Miggy and Dharsi", True, COLOR_TEXT)
-            credit_text_3 = self.font_small.render("Score system by Azavech", True, COLOR_TEXT)
-            credit_text_4 = self.font_small.render("Ported to Pygame by lululombard", True, COLOR_TEXT)
-
-            for x_offset in [self.half_width // 2, self.half_width + self.half_width // 2]:
-                title_rect = title.get_rect(center=(x_offset, self.height // 2 - 180))
-                self.screen.blit(title, title_rect)
-                rule_rect_1 = rule_text_1.get_rect(center=(x_offset, self.height // 2 - 100))
-                self.screen.blit(rule_text_1, rule_rect_1)
-                rule_rect_2 = rule_text_2.get_rect(center=(x_offset, self.height // 2 - 65))
-                self.screen.blit(rule_text_2, rule_rect_2)
-                start_rect = start_text.get_rect(center=(x_offset, self.height // 2 + 20))
-                self.screen.blit(start_text, start_rect)
-                credit_rect_1 = credit_text_1.get_rect(center=(x_offset, self.height // 2 + 160))
-                self.screen.blit(credit_text_1, credit_rect_1)
-                credit_rect_2 = credit_text_2.get_rect(center=(x_offset, self.height // 2 + 195))
-                self.screen.blit(credit_text_2, credit_rect_2)
-                credit_rect_3 = credit_text_3.get_rect(center=(x_offset, self.height // 2 + 230))
-                self.screen.blit(credit_text_3, credit_rect_3)
-                credit_rect_4 = credit_text_4.get_rect(center=(x_offset, self.height // 2 + 265))
-                self.screen.blit(credit_text_4, credit_rect_4)
+            for surf, rect in self._idle_blits:
+                self.screen.blit(surf, rect)
 
         elif self.state == GameState.PLAYING:
-            self.draw_circle_display(self.screen, self.half_width // 2, self.height // 2, mirror=False)
-            self.draw_circle_display(self.screen, self.half_width + self.half_width // 2, self.height // 2, mirror=True)
+            # Right display is the left one mirrored horizontally (counter-clockwise),
+            # so the geometry is drawn once and flipped
+            self._left_surf.fill(COLOR_BG)
+            marker_rect = self.draw_circle_display(self._left_surf, self.half_width // 2, self.height // 2)
+            self.screen.blit(self._left_surf, (0, 0))
+            self.screen.blit(pygame.transform.flip(self._left_surf, True, False), (self.half_width, 0))
+            for x_offset in [self.half_width // 2, self.half_width + self.half_width // 2]:
+                self.draw_circle_text(self.screen, x_offset, self.height // 2)
+            mirrored_rect = pygame.Rect(self.width - marker_rect.right, marker_rect.top,
+                                        marker_rect.width, marker_rect.height)
+            dirty = [marker_rect, mirrored_rect] + self._text_rects
 
         elif self.state == GameState.WIN:
             self.screen.fill(COLOR_WIN)
-            win_text = self.font_large.render("YOU WIN!", True, COLOR_BG)
-            max_score = NUM_LEVELS * 10
-            score_text = self.font_medium.render(f"Score: {self.score} / {max_score}", True, COLOR_BG)
-            restart_text = self.font_small.render("Press A to play again", True, COLOR_BG)
-            menu_text = self.font_small.render("Press B for menu", True, COLOR_BG)
-
-            for x_offset in [self.half_width // 2, self.half_width + self.half_width // 2]:
-                win_rect = win_text.get_rect(center=(x_offset, self.height // 2 - 70))
-                self.screen.blit(win_text, win_rect)
-                score_rect = score_text.get_rect(center=(x_offset, self.height // 2))
-                self.screen.blit(score_text, score_rect)
-                restart_rect = restart_text.get_rect(center=(x_offset, self.height // 2 + 70))
-                self.screen.blit(restart_text, restart_rect)
-                menu_rect = menu_text.get_rect(center=(x_offset, self.height // 2 + 110))
-                self.screen.blit(menu_text, menu_rect)
+            for surf, rect in self._win_blits:
+                self.screen.blit(surf, rect)
 
         elif self.state == GameState.LOSE:
             self.screen.fill(COLOR_LOSE)
-            lose_text = self.font_large.render("GAME OVER", True, COLOR_BG)
-            restart_text = self.font_small.render("Press A to try again", True, COLOR_BG)
-            menu_text = self.font_small.render("Press B for menu", True, COLOR_BG)
-
-            for x_offset in [self.half_width // 2, self.half_width + self.half_width // 2]:
-                lose_rect = lose_text.get_rect(center=(x_offset, self.height // 2 - 50))
-                self.screen.blit(lose_text, lose_rect)
-                restart_rect = restart_text.get_rect(center=(x_offset, self.height // 2 + 50))
-                self.screen.blit(restart_text, restart_rect)
-                menu_rect = menu_text.get_rect(center=(x_offset, self.height // 2 + 90))
-                self.screen.blit(menu_text, menu_rect)
-
-        pygame.display.flip()
+            for surf, rect in self._lose_blits:
+                self.screen.blit(surf, rect)
+
+        frame_key = (self.state, self.current_level)
+        if frame_key != self._last_frame_key:
+            # State or target changed: push the whole frame once
+            self._last_frame_key = frame_key
+            pygame.display.flip()
+        else:
+            # Include last frame's rects so the old marker position gets cleared
+            pygame.display.update(self._prev_dirty + dirty)
+        self._prev_dirty = dirty
 
     def run(self):
         running = True
@@ -401,7 +497,7 @@ class RingDingGame:
             print("[RingDing] Game started. Press A to begin!")
 
         while running:
-            for event in pygame.event.get():
+            for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
@@ -416,7 +512,8 @@ class RingDingGame:
 
             self.update()
             self.draw()
-            self.clock.tick(self.fps)
+            # Busy-loop pacing: SDL_Delay alone is too coarse to hold 60 FPS
+            self.clock.tick_busy_loop(self.fps)
 
         print("[RingDing] Game ended")
         pygame.quit()
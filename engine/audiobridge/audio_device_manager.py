@@ -100,6 +100,22 @@ class AudioDeviceManager:
             print(f"[AudioDeviceManager] Error setting device: {e}")
             return False
 
+    @staticmethod
+    def sink_mac(sink_name: str) -> Optional[str]:
+        """
+        MAC address of a Bluetooth sink, parsed from its name.
+
+        BlueZ sinks are named "bluez_sink.AA_BB_CC_DD_EE_FF.a2dp_sink"
+        (PulseAudio) or "bluez_output.AA_BB_CC_DD_EE_FF.1" (PipeWire).
+        Returns "AA:BB:CC:DD:EE:FF", or None for any other sink.
+        """
+        if not sink_name.startswith("bluez_"):
+            return None
+        parts = sink_name.split(".", 2)
+        if len(parts) < 2 or len(parts[1]) != 17:
+            return None
+        return parts[1].replace("_", ":").upper()
+
     def is_hdmi_device(self, sink_name: str) -> bool:
         """Check if a device is an HDMI output."""
         return "hdmi" in sink_name.lower()
@@ -126,15 +142,31 @@ class AudioDeviceManager:
         return None
 
     def find_bluetooth_sink_by_mac(self, mac: str) -> Optional[str]:
-        """Find Bluetooth sink name by MAC address."""
-        devices = self.list_devices()
-        mac_clean = mac.replace(":", "_").lower()
+        """
+        Find Bluetooth sink name by MAC address.
 
-        for device in devices:
-            if self.is_bluetooth_device(device["name"]):
-                if mac_clean in device["name"].lower():
-                    print(f"[AudioDeviceManager] Found BT sink for {mac}: {device['name']}")
-                    return device["name"]
+        Single pass over the raw sink list: matches the bluez device.string
+        property (the MAC) first, falling back to the MAC embedded in the
+        sink name. Skips list_devices() so no device dicts are built or logged.
+        """
+        try:
+            with self._pulse() as pulse:
+                sinks = pulse.sink_list()
+        except Exception as e:
+            print(f"[AudioDeviceManager] Error listing sinks: {e}")
+            return None
+
+        mac_upper = mac.upper()
+        mac_clean = mac.replace(":", "_").lower()
+        for sink in sinks:
+            # Lower-case the name once for both checks (is_bluetooth_device inlined)
+            name_lower = sink.name.lower()
+            if "bluez" not in name_lower and "bluetooth" not in name_lower:
+                continue
+            if (sink.proplist.get("device.string", "").upper() == mac_upper
+                    or mac_clean in name_lower):
+                print(f"[AudioDeviceManager] Found BT sink for {mac}: {sink.name}")
+                return sink.name
 
         print(f"[AudioDeviceManager] No BT sink found for {mac}")
         return None
@@ -153,7 +185,8 @@ class AudioDeviceManager:
             mac_clean = mac.replace(":", "_").lower()
             with self._pulse() as pulse:
                 for card in pulse.card_list():
-                    if "bluez_card" in card.name.lower() and mac_clean in card.name.lower():
+                    card_name = card.name.lower()
+                    if "bluez_card" in card_name and mac_clean in card_name:
                         profile = card.profile_active
                         if profile:
                             print(f"[AudioDeviceManager] BT device {mac} profile: {profile.name}")
@@ -169,7 +202,8 @@ class AudioDeviceManager:
             mac_clean = mac.replace(":", "_").lower()
             with self._pulse() as pulse:
                 for card in pulse.card_list():
-                    if "bluez_card" in card.name.lower() and mac_clean in card.name.lower():
+                    card_name = card.name.lower()
+                    if "bluez_card" in card_name and mac_clean in card_name:
                         # Find A2DP profile
                         for profile in card.profile_list:
                             if "a2dp" in profile.name.lower() and profile.available != 0:
@@ -10,6 +10,7 @@ import json
 import subprocess
 import threading
 import time
+import traceback
 import os
 import sys
 from typing import Optional, Dict
@@ -22,6 +23,18 @@ from utils.mqtt_client import create_mqtt_client
 from utils.notifications import publish_notification
 from audiobridge.audio_device_manager import AudioDeviceManager
 
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    # Compact like orjson: no spaces after separators
+    _JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+    def _dumps(obj) -> bytes:
+        return _JSON_ENCODER.encode(obj).encode()
+
 
 class AudioBridge:
     """
@@ -66,6 +79,12 @@ class AudioBridge:
         self.last_selected_device: Optional[str] = None  # Restored from retained MQTT
         self.bt_device_mac_to_sink: Dict[str, str] = {}  # BT MAC → sink name
         self._last_published_volume: Optional[int] = None  # Dedup external changes
+        self._last_published: Dict[str, bytes] = {}  # {topic: last retained payload}
+        # Bumped by the pulse monitor on every new sink (see _wait_for_bt_sink)
+        self._sink_added = threading.Condition()
+        self._sinks_added = 0
+        # Environment for pactl/pulseaudio calls, built once
+        self._pa_env = {**os.environ, "XDG_RUNTIME_DIR": f"/run/user/{os.getuid()}"}
 
         print("[AudioBridge] Initialized")
 
@@ -79,7 +98,7 @@ class AudioBridge:
                     ["pactl", "info"],
                     capture_output=True,
                     timeout=2,
-                    env={**os.environ, "XDG_RUNTIME_DIR": f"/run/user/{os.getuid()}"}
+                    env=self._pa_env,
                 )
                 if result.returncode == 0 and b"Server Name:" in result.stdout:
                     if attempt > 0:
@@ -95,7 +114,7 @@ class AudioBridge:
         """Reload PulseAudio Bluetooth module to fix profile issues."""
         print("[AudioBridge] Reloading PulseAudio Bluetooth module...")
         try:
-            env = {**os.environ, "XDG_RUNTIME_DIR": f"/run/user/{os.getuid()}"}
+            env = self._pa_env
             subprocess.run(["pactl", "unload-module", "module-bluetooth-discover"],
                            capture_output=True, timeout=5, env=env)
             time.sleep(1)
@@ -118,7 +137,7 @@ class AudioBridge:
         try:
             check_result = subprocess.run(
                 ["pactl", "info"],
-                capture_output=True, text=True, timeout=2
+                capture_output=True, text=True, timeout=2, env=self._pa_env
             )
 
             if check_result.returncode == 0:
@@ -126,7 +145,7 @@ class AudioBridge:
             else:
                 print("[AudioBridge] Starting PulseAudio...")
                 subprocess.run(["pulseaudio", "--start"],
-                               capture_output=True, text=True, timeout=5)
+                               capture_output=True, text=True, timeout=5, env=self._pa_env)
                 time.sleep(3)
 
             # If default is HDMI, switch to non-HDMI
@@ -153,6 +172,8 @@ class AudioBridge:
         def on_connect(client, userdata, flags, rc, properties=None):
             if rc == 0:
                 print("[AudioBridge] Connected to MQTT broker")
+                # Broker may have lost retained state: let the next publishes through
+                self._last_published.clear()
                 # BT audio device updates from bluetoothbridge
                 client.subscribe("protogen/fins/bluetoothbridge/status/audio_devices")
                 # Volume control
@@ -198,7 +219,6 @@ class AudioBridge:
                 self.handle_config_reload()
         except Exception as e:
             print(f"[AudioBridge] Error handling {topic}: {e}")
-            import traceback
             traceback.print_exc()
 
     def handle_config_reload(self):
@@ -247,11 +267,7 @@ class AudioBridge:
                 "min": self.volume_min,
                 "max": self.volume_max,
             }
-            self.mqtt_client.publish(
-                "protogen/fins/audiobridge/status/volume",
-                json.dumps(status),
-                retain=True,
-            )
+            self._publish_retained("protogen/fins/audiobridge/status/volume", status)
         except Exception as e:
             print(f"[AudioBridge] Error publishing volume: {e}")
 
@@ -292,7 +308,11 @@ class AudioBridge:
 
     def _on_pulse_event(self, ev):
         """Handle PulseAudio sink events — republish if volume changed externally."""
-        if ev.t == 'change':
+        if ev.t == 'new':
+            with self._sink_added:
+                self._sinks_added += 1
+                self._sink_added.notify_all()
+        elif ev.t == 'change':
             volume = self.get_current_volume()
             if volume != self._last_published_volume:
                 self.publish_volume_status()
@@ -350,12 +370,8 @@ class AudioBridge:
                 was_current = (current_device == sink_name) or \
                               (current_device and mac_normalized in current_device.upper())
 
-                if was_current and self.fallback_to_non_hdmi:
-                    print("[AudioBridge] Current device was unpaired, falling back...")
-                    fallback = self.audio_device_manager.get_non_hdmi_fallback(exclude_mac=mac)
-                    if fallback:
-                        if self.audio_device_manager.set_default_device(fallback):
-                            print(f"[AudioBridge] Fell back to {fallback}")
+                if was_current:
+                    self._fall_back_from(mac, "unpaired")
 
                 del self.bt_device_mac_to_sink[mac]
                 self.publish_current_audio_device(exclude_mac=mac)
@@ -388,32 +404,25 @@ class AudioBridge:
 
         except Exception as e:
             print(f"[AudioBridge] Error handling BT audio update: {e}")
-            import traceback
             traceback.print_exc()
 
     def _handle_bt_device_connected(self, mac: str, name: str):
         """Handle a BT audio device connecting."""
         print(f"[AudioBridge] BT audio device connected: {name} ({mac})")
 
-        # Wait for PulseAudio to detect the device
-        time.sleep(2)
+        # Ensure A2DP profile for high-quality audio before waiting for the
+        # sink: the card exists first, and one left on the "off"/HSP profile
+        # may get no A2DP sink until it is switched
+        card_found = self._ensure_a2dp_profile(mac, name)
 
-        # Ensure A2DP profile for high-quality audio
-        current_profile = self.audio_device_manager.get_bluetooth_card_profile(mac)
-        if current_profile and "a2dp" not in current_profile.lower():
-            print(f"[AudioBridge] Switching {name} to A2DP profile...")
-            self.audio_device_manager.set_bluetooth_profile_a2dp(mac)
-            time.sleep(2)
-
-        # Find the PulseAudio sink with retries
-        sink_name = None
-        for attempt in range(5):
-            sink_name = self.audio_device_manager.find_bluetooth_sink_by_mac(mac)
-            if sink_name:
-                break
-            if attempt < 4:
-                print(f"[AudioBridge] Sink not found yet, retrying... ({attempt + 1}/5)")
-                time.sleep(2)
+        # Wait for PulseAudio to create the sink
+        sink_name = self._wait_for_bt_sink(mac)
+
+        # Card wasn't there yet on the first check: it is once the sink is
+        if sink_name and card_found is None and self._ensure_a2dp_profile(mac, name):
+            # The profile switch replaces the sink (PipeWire may keep its name)
+            sink_name = (self._wait_for_bt_sink(mac, timeout=2.0, exclude=sink_name)
+                         or self.audio_device_manager.find_bluetooth_sink_by_mac(mac))
 
         if sink_name:
             self.bt_device_mac_to_sink[mac] = sink_name
@@ -431,9 +440,45 @@ class AudioBridge:
             publish_notification(self.mqtt_client, "audio", "connected", "speaker",
                                  f"Speaker connected: {name}")
         else:
-            print(f"[AudioBridge] Could not find sink for {mac} after 5 attempts")
+            print(f"[AudioBridge] Could not find sink for {mac}")
             threading.Timer(5.0, self.publish_audio_devices_status).start()
 
+    def _ensure_a2dp_profile(self, mac: str, name: str) -> Optional[bool]:
+        """
+        Switch the device's card to A2DP if it is on another profile.
+
+        Returns True if the profile was switched, False if no switch was
+        needed (or it failed), None if the card doesn't exist yet.
+        """
+        current_profile = self.audio_device_manager.get_bluetooth_card_profile(mac)
+        if current_profile is None:
+            return None
+        if "a2dp" in current_profile.lower():
+            return False
+        print(f"[AudioBridge] Switching {name} to A2DP profile...")
+        return self.audio_device_manager.set_bluetooth_profile_a2dp(mac)
+
+    def _wait_for_bt_sink(self, mac: str, timeout: float = 10.0,
+                          exclude: Optional[str] = None) -> Optional[str]:
+        """
+        Wait for the PulseAudio sink of a BT device to appear.
+
+        Re-checks only when the pulse monitor reports a new sink instead of
+        polling on a fixed interval. Returns None on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            # Snapshot before looking so a sink added in between still wakes us
+            seen = self._sinks_added
+            sink_name = self.audio_device_manager.find_bluetooth_sink_by_mac(mac)
+            if sink_name and sink_name != exclude:
+                return sink_name
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            with self._sink_added:
+                self._sink_added.wait_for(lambda: self._sinks_added != seen, remaining)
+
     def _handle_bt_device_disconnected(self, mac: str, name: str):
         """Handle a BT audio device disconnecting."""
         current_device = self.audio_device_manager.get_current_device()
@@ -452,18 +497,23 @@ class AudioBridge:
             print(f"[AudioBridge] BT audio device disconnected: {name}")
 
         # Fallback to non-HDMI if we were using this device
-        if was_current and self.fallback_to_non_hdmi:
-            print("[AudioBridge] Current device disconnected, falling back...")
-            fallback = self.audio_device_manager.get_non_hdmi_fallback()
-            if fallback:
-                if self.audio_device_manager.set_default_device(fallback):
-                    print(f"[AudioBridge] Fell back to {fallback}")
+        if was_current:
+            self._fall_back_from(mac, "disconnected")
 
         self.publish_current_audio_device()
 
         publish_notification(self.mqtt_client, "audio", "disconnected", "speaker",
                              f"Speaker disconnected: {name}")
 
+    def _fall_back_from(self, mac: str, reason: str):
+        """Switch the default sink to a non-HDMI device other than the BT device at mac."""
+        if not self.fallback_to_non_hdmi:
+            return
+        print(f"[AudioBridge] Current device {reason}, falling back...")
+        fallback = self.audio_device_manager.get_non_hdmi_fallback(exclude_mac=mac)
+        if fallback and self.audio_device_manager.set_default_device(fallback):
+            print(f"[AudioBridge] Fell back to {fallback}")
+
     # ======== Status Publishing ========
 
     def publish_audio_devices_status(self, exclude_macs: set = None):
@@ -479,26 +529,28 @@ class AudioBridge:
             if self.exclude_hdmi:
                 devices = [d for d in devices if not self.audio_device_manager.is_hdmi_device(d["name"])]
 
-            # Filter recently unpaired devices
+            # Filter recently unpaired devices: one name parse + set lookup per sink
             if exclude_macs:
-                def should_exclude(device_name):
-                    for mac in exclude_macs:
-                        mac_pattern = mac.replace(":", "_").upper()
-                        if mac_pattern in device_name.upper():
-                            return True
-                    return False
-                devices = [d for d in devices if not should_exclude(d["name"])]
-
-            self.mqtt_client.publish(
-                "protogen/fins/audiobridge/status/audio_devices",
-                json.dumps(devices),
-                retain=True,
-            )
+                exclude = {mac.upper() for mac in exclude_macs}
+                sink_mac = self.audio_device_manager.sink_mac
+                devices = [d for d in devices if sink_mac(d["name"]) not in exclude]
+
+            self._publish_retained("protogen/fins/audiobridge/status/audio_devices", devices)
             print(f"[AudioBridge] Published {len(devices)} audio devices")
 
         except Exception as e:
             print(f"[AudioBridge] Error publishing audio devices: {e}")
 
+    def _publish_retained(self, topic: str, data):
+        """Publish a retained status payload, skipping it if identical to the last one sent."""
+        payload = _dumps(data)
+        if self._last_published.get(topic) == payload:
+            return
+        info = self.mqtt_client.publish(topic, payload, retain=True)
+        # Only remember payloads that went out, so a dropped one is retried
+        if info.rc == mqtt.MQTT_ERR_SUCCESS:
+            self._last_published[topic] = payload
+
     def publish_current_audio_device(self, exclude_mac: str = None):
         """Publish current audio output device."""
         if not self.mqtt_client:
@@ -508,8 +560,7 @@ class AudioBridge:
 
             # Skip if current device was just unpaired
             if exclude_mac and current_sink:
-                mac_pattern = exclude_mac.replace(":", "_").upper()
-                if mac_pattern in current_sink.upper():
+                if self.audio_device_manager.sink_mac(current_sink) == exclude_mac.upper():
                     return
 
             if current_sink:
@@ -519,11 +570,7 @@ class AudioBridge:
                     "description": device_info["description"] if device_info else current_sink,
                     "type": device_info["type"] if device_info else "unknown",
                 }
-                self.mqtt_client.publish(
-                    "protogen/fins/audiobridge/status/audio_device/current",
-                    json.dumps(status),
-                    retain=True,
-                )
+                self._publish_retained("protogen/fins/audiobridge/status/audio_device/current", status)
 
         except Exception as e:
             print(f"[AudioBridge] Error publishing current device: {e}")
@@ -5,14 +5,19 @@ Publishes device state for controllerbridge (gamepads) and audiobridge (speakers
 """
 
 import paho.mqtt.client as mqtt
+from paho.mqtt.subscribeoptions import SubscribeOptions
 import signal
+import functools
 import json
 import subprocess
 import threading
 import time
 import sys
 import os
-from typing import Optional, Dict
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, astuple
+from typing import Optional, Dict, Callable
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -24,12 +29,55 @@ from utils.service_controller import ServiceController
 from bluetoothbridge.bluez_dbus import (
     BluezManager, BluezDevice, BluezAdapter,
     is_gamepad, is_audio_device,
-    dbus_path_to_mac, dbus_path_adapter,
+    dbus_path_to_mac, dbus_path_adapter, mac_to_dbus_path, normalize_mac,
+    rfkill_unblock_bluetooth, sysfs_battery,
     BLUEZ_DEVICE_IFACE, BLUEZ_BATTERY_IFACE,
 )
 
 from gi.repository import GLib
 
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    # Compact like orjson: no spaces after separators
+    _dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=asdict).encode
+    _loads = json.loads
+
+# AA:BB:CC:DD:EE:FF in either case, as accepted from MQTT payloads
+_MAC_ADDR_RE = re.compile(r"(?:[0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}")
+
+
+_SUBSCRIBE_TOPICS = (
+    "protogen/fins/bluetoothbridge/scan/start",
+    "protogen/fins/bluetoothbridge/scan/stop",
+    "protogen/fins/bluetoothbridge/connect",
+    "protogen/fins/bluetoothbridge/disconnect",
+    "protogen/fins/bluetoothbridge/unpair",
+    "protogen/fins/bluetoothbridge/bluetooth/restart",
+    "protogen/fins/bluetoothbridge/forget_disconnected",
+    "protogen/fins/config/reload",
+    "protogen/fins/bluetoothbridge/config/reload",
+)
+
+# Retained by us; subscribed separately with v5 options (see on_connect)
+_LAST_AUDIO_DEVICE_TOPIC = "protogen/fins/bluetoothbridge/status/last_audio_device"
+
+
+@dataclass(slots=True)
+class DeviceInfo:
+    """A tracked device, published as one JSON object in the device lists."""
+    mac: str
+    name: str
+    paired: bool = False
+    connected: bool = False
+    battery: Optional[int] = None
+    type: str = "gamepad"
+
 
 class BluetoothBridge:
     """
@@ -60,6 +108,9 @@ class BluetoothBridge:
         self.config_loader = ConfigLoader()
         self.mqtt_client: Optional[mqtt.Client] = None
         self.running = False
+        self._stop_event = threading.Event()
+        self._mqtt_connected = threading.Event()
+        self._mqtt_ready = False  # publish_* are no-ops until on_connect, and after cleanup
 
         # BlueZ D-Bus manager
         self.bluez = BluezManager()
@@ -69,16 +120,55 @@ class BluetoothBridge:
         self.scanning = False
 
         # Device tracking
-        self.discovered_devices: Dict[str, Dict] = {}  # gamepads: {mac: {name, paired, connected}}
-        self.audio_devices: Dict[str, Dict] = {}        # audio: {mac: {name, paired, connected, type}}
+        self.discovered_devices: Dict[str, DeviceInfo] = {}  # gamepads: {mac: DeviceInfo}
+        self.audio_devices: Dict[str, DeviceInfo] = {}        # audio: {mac: DeviceInfo(type="audio")}
         self.last_audio_device_to_restore: Optional[Dict] = None
-
-        # State lock for signal-driven updates
-        self._state_lock = threading.Lock()
+        # Reverse map {mac: adapter}, kept in step with the two dicts above
+        self._mac_to_adapter: Dict[str, str] = {}
+
+        # State locks for signal-driven updates, one per dict so gamepad and
+        # audio updates don't serialize. When both are needed, take
+        # _gp_lock first.
+        self._gp_lock = threading.Lock()
+        self._audio_lock = threading.Lock()
+
+        # Coalesced device list publishes (see _mark_dirty)
+        self._dirty = {"gamepads": False, "audio": False}
+        self._publish_lock = threading.Lock()
+        self._publish_timer: Optional[threading.Timer] = None
+        self._last_devices_fp: Optional[int] = None  # Fingerprints of last published lists
+        self._last_audio_fp: Optional[int] = None
+
+        # Throttle for _load_paired_devices (GetManagedObjects walk)
+        self._paired_cache_ts = 0.0
+        self._paired_cache_ttl = 2.0
+
+        # Shared pool for connect/disconnect/reconnect D-Bus calls, serialized per adapter
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="btb")
+        self._adapter_locks: Dict[str, threading.Lock] = {}
 
         # Adapter config
         self.gamepad_adapter, self.audio_adapter = self._load_adapter_config()
 
+        # MQTT topic → handler(payload)
+        self._handlers: Dict[str, Callable[[bytes], None]] = {
+            "protogen/fins/bluetoothbridge/scan/start": lambda p: self.start_scan(),
+            "protogen/fins/bluetoothbridge/scan/stop": lambda p: self.stop_scan(),
+            "protogen/fins/bluetoothbridge/connect":
+                lambda p: self._handle_mac_payload(self.connect_device, p),
+            "protogen/fins/bluetoothbridge/disconnect":
+                lambda p: self._handle_mac_payload(self.disconnect_device, p),
+            "protogen/fins/bluetoothbridge/unpair":
+                lambda p: self._handle_mac_payload(self.unpair_device, p),
+            # Power cycle / service restart takes seconds: keep it off the MQTT thread
+            "protogen/fins/bluetoothbridge/bluetooth/restart":
+                lambda p: self._pool.submit(self.restart_bluetooth),
+            "protogen/fins/bluetoothbridge/forget_disconnected": lambda p: self.forget_disconnected(),
+            _LAST_AUDIO_DEVICE_TOPIC: self._restore_last_audio_device,
+            "protogen/fins/config/reload": lambda p: self.handle_config_reload(),
+            "protogen/fins/bluetoothbridge/config/reload": lambda p: self.handle_config_reload(),
+        }
+
         print(f"[BluetoothBridge] Initialized (gamepads: {self.gamepad_adapter}, audio: {self.audio_adapter})")
 
     def _load_adapter_config(self) -> tuple:
@@ -93,16 +183,30 @@ class BluetoothBridge:
         return "hci0", "hci1"
 
     def _get_adapter_for_device(self, mac: str) -> str:
-        """Route device to the correct adapter based on type."""
-        if mac in self.audio_devices:
-            return self.audio_adapter
-        return self.gamepad_adapter
+        """Route device to the correct adapter based on type (lock-free)."""
+        return self._mac_to_adapter.get(mac, self.gamepad_adapter)
+
+    def _submit_device_task(self, worker: Callable[[str], None], mac: str):
+        """Run a device worker on the pool, one at a time per adapter."""
+        def run():
+            adapter_name = self._get_adapter_for_device(mac)
+            lock = self._adapter_locks.get(adapter_name)
+            if lock is None:
+                lock = self._adapter_locks.setdefault(adapter_name, threading.Lock())
+            with lock:
+                worker(mac)
+
+        self._pool.submit(run)
 
     # ======== D-Bus Signal Handlers ========
 
     def _on_interfaces_added(self, path: str, interfaces: dict):
         """Handle new device discovered during scan (InterfacesAdded signal)."""
-        if BLUEZ_DEVICE_IFACE not in interfaces:
+        # Cheapest checks first: adapters, agents, media endpoints etc. land here too
+        if "/dev_" not in path:
+            return
+        props = interfaces.get(BLUEZ_DEVICE_IFACE)
+        if props is None:
             return
 
         # Only track devices on configured adapters
@@ -110,15 +214,15 @@ class BluetoothBridge:
         if adapter not in (self.gamepad_adapter, self.audio_adapter):
             return
 
-        props = interfaces[BLUEZ_DEVICE_IFACE]
         mac = dbus_path_to_mac(path)
         if not mac:
             return
 
-        name = str(props.get("Name", props.get("Alias", mac)))
-        paired = bool(props.get("Paired", False))
-        connected = bool(props.get("Connected", False))
-        icon = str(props.get("Icon", ""))
+        props_get = props.get
+        name = str(props_get("Name") or props_get("Alias") or mac)
+        paired = bool(props_get("Paired", False))
+        connected = bool(props_get("Connected", False))
+        icon = str(props_get("Icon", ""))
 
         # Check for battery info
         battery = None
@@ -127,26 +231,25 @@ class BluetoothBridge:
             if "Percentage" in batt_props:
                 battery = int(batt_props["Percentage"])
 
-        with self._state_lock:
-            if is_gamepad(name, icon):
+        if is_gamepad(name, icon):
+            with self._gp_lock:
                 if mac not in self.discovered_devices:
-                    self.discovered_devices[mac] = {
-                        "mac": mac, "name": name,
-                        "paired": paired, "connected": connected,
-                        "battery": battery,
-                    }
+                    self._mac_to_adapter[mac] = self.gamepad_adapter
+                    self.discovered_devices[mac] = DeviceInfo(
+                        mac, name, paired=paired, connected=connected,
+                        battery=battery)
                     print(f"[BluetoothBridge] Discovered gamepad: {name} ({mac})")
-                    self.publish_devices_status()
+                    self._mark_dirty("gamepads")
 
-            elif is_audio_device(name, icon):
+        elif is_audio_device(name, icon):
+            with self._audio_lock:
                 if mac not in self.audio_devices:
-                    self.audio_devices[mac] = {
-                        "mac": mac, "name": name,
-                        "paired": paired, "connected": connected,
-                        "type": "audio", "battery": battery,
-                    }
+                    self._mac_to_adapter[mac] = self.audio_adapter
+                    self.audio_devices[mac] = DeviceInfo(
+                        mac, name, paired=paired, connected=connected,
+                        battery=battery, type="audio")
                     print(f"[BluetoothBridge] Discovered audio device: {name} ({mac})")
-                    self.publish_audio_devices_status()
+                    self._mark_dirty("audio")
 
     def _on_interfaces_removed(self, path: str, interfaces: list):
         """Handle device removed (InterfacesRemoved signal)."""
@@ -157,25 +260,32 @@ class BluetoothBridge:
         if not mac:
             return
 
-        with self._state_lock:
+        # Stale proxy: BlueZ will create a new object if the device comes back
+        self.bluez.forget_device(dbus_path_adapter(path), mac)
+
+        with self._gp_lock:
             if mac in self.discovered_devices:
                 print(f"[BluetoothBridge] Device removed: {mac}")
                 del self.discovered_devices[mac]
-                self.publish_devices_status()
+                self._mac_to_adapter.pop(mac, None)
+                self._mark_dirty("gamepads")
 
+        with self._audio_lock:
             if mac in self.audio_devices:
                 print(f"[BluetoothBridge] Audio device removed: {mac}")
                 del self.audio_devices[mac]
-                self.publish_audio_devices_status()
+                self._mac_to_adapter.pop(mac, None)
+                self._mark_dirty("audio")
 
     def _on_properties_changed(self, connection, sender, obj, iface, signal_name, params):
         """Handle PropertiesChanged signal (connection state, name, battery updates)."""
-        iface_name, changed, invalidated = params
-
-        if iface_name not in (BLUEZ_DEVICE_IFACE, BLUEZ_BATTERY_IFACE):
+        path = obj
+        if "/dev_" not in path:
             return
 
-        path = obj
+        # Only Device1 and Battery1 changes are delivered (arg0 match rules)
+        iface_name, changed, invalidated = params
+
         mac = dbus_path_to_mac(path)
         if not mac:
             return
@@ -184,60 +294,31 @@ class BluetoothBridge:
         if iface_name == BLUEZ_BATTERY_IFACE:
             if "Percentage" in changed:
                 battery = int(changed["Percentage"])
-                with self._state_lock:
+                with self._gp_lock:
                     if mac in self.discovered_devices:
-                        self.discovered_devices[mac]["battery"] = battery
-                        self.publish_devices_status()
+                        self.discovered_devices[mac].battery = battery
+                        self._mark_dirty("gamepads")
+                with self._audio_lock:
                     if mac in self.audio_devices:
-                        self.audio_devices[mac]["battery"] = battery
-                        self.publish_audio_devices_status()
+                        self.audio_devices[mac].battery = battery
+                        self._mark_dirty("audio")
             return
 
-        with self._state_lock:
-            # Handle connection state changes
-            if "Connected" in changed:
-                connected = bool(changed["Connected"])
-
-                # If device isn't tracked yet but just connected, look it up and add it
-                if connected and mac not in self.discovered_devices and mac not in self.audio_devices:
-                    try:
-                        adapter_name = dbus_path_adapter(path)
-                        device = self.bluez.get_device(adapter_name or self.gamepad_adapter, mac)
-                        name = device.name
-                        icon = device.icon
-                        paired = device.paired
-                        battery = device.battery
-
-                        if is_gamepad(name, icon):
-                            self.discovered_devices[mac] = {
-                                "mac": mac, "name": name,
-                                "paired": paired, "connected": True,
-                                "battery": battery,
-                            }
-                            print(f"[BluetoothBridge] Gamepad connected (new): {name} ({mac})")
-                            publish_notification(self.mqtt_client, "bluetooth", "connected",
-                                                 "gamepad", f"Controller connected: {name}")
-                            self.publish_devices_status()
-                        elif is_audio_device(name, icon):
-                            self.audio_devices[mac] = {
-                                "mac": mac, "name": name,
-                                "paired": paired, "connected": True,
-                                "type": "audio", "battery": battery,
-                            }
-                            print(f"[BluetoothBridge] Audio device connected (new): {name} ({mac})")
-                            self.publish_last_audio_device(mac)
-                            publish_notification(self.mqtt_client, "bluetooth", "connected",
-                                                 "speaker", f"Speaker connected: {name}")
-                            self.publish_audio_devices_status()
+        connected = bool(changed["Connected"]) if "Connected" in changed else None
 
-                    except Exception as e:
-                        print(f"[BluetoothBridge] Could not look up new device {mac}: {e}")
+        # If device isn't tracked yet but just connected, look it up and add it
+        if connected and mac not in self.discovered_devices and mac not in self.audio_devices:
+            self._add_connected_device(path, mac)
 
-                if mac in self.discovered_devices:
-                    old_state = self.discovered_devices[mac].get("connected", False)
-                    self.discovered_devices[mac]["connected"] = connected
+        with self._gp_lock:
+            info = self.discovered_devices.get(mac)
+            if info is not None:
+                # Handle connection state changes
+                if connected is not None:
+                    old_state = info.connected
+                    info.connected = connected
                     if connected != old_state:
-                        name = self.discovered_devices[mac].get("name", mac)
+                        name = info.name
                         if connected:
                             print(f"[BluetoothBridge] Gamepad connected: {name} ({mac})")
                             publish_notification(self.mqtt_client, "bluetooth", "connected",
@@ -246,13 +327,25 @@ class BluetoothBridge:
                             print(f"[BluetoothBridge] Gamepad disconnected: {name} ({mac})")
                             publish_notification(self.mqtt_client, "bluetooth", "disconnected",
                                                  "gamepad", f"Controller disconnected: {name}")
-                        self.publish_devices_status()
-
-                if mac in self.audio_devices:
-                    old_state = self.audio_devices[mac].get("connected", False)
-                    self.audio_devices[mac]["connected"] = connected
+                        self._mark_dirty("gamepads")
+
+                # Handle name updates
+                if "Name" in changed:
+                    info.name = str(changed["Name"])
+
+                # Handle paired state
+                if "Paired" in changed:
+                    info.paired = bool(changed["Paired"])
+                    self._mark_dirty("gamepads")
+
+        with self._audio_lock:
+            info = self.audio_devices.get(mac)
+            if info is not None:
+                if connected is not None:
+                    old_state = info.connected
+                    info.connected = connected
                     if connected != old_state:
-                        name = self.audio_devices[mac].get("name", mac)
+                        name = info.name
                         if connected:
                             print(f"[BluetoothBridge] Audio device connected: {name} ({mac})")
                             self.publish_last_audio_device(mac)
@@ -262,25 +355,53 @@ class BluetoothBridge:
                             print(f"[BluetoothBridge] Audio device disconnected: {name} ({mac})")
                             publish_notification(self.mqtt_client, "bluetooth", "disconnected",
                                                  "speaker", f"Speaker disconnected: {name}")
-                        self.publish_audio_devices_status()
+                        self._mark_dirty("audio")
 
-            # Handle name updates
-            if "Name" in changed:
-                new_name = str(changed["Name"])
-                if mac in self.discovered_devices:
-                    self.discovered_devices[mac]["name"] = new_name
-                if mac in self.audio_devices:
-                    self.audio_devices[mac]["name"] = new_name
+                if "Name" in changed:
+                    info.name = str(changed["Name"])
 
-            # Handle paired state
-            if "Paired" in changed:
-                paired = bool(changed["Paired"])
-                if mac in self.discovered_devices:
-                    self.discovered_devices[mac]["paired"] = paired
-                    self.publish_devices_status()
-                if mac in self.audio_devices:
-                    self.audio_devices[mac]["paired"] = paired
-                    self.publish_audio_devices_status()
+                if "Paired" in changed:
+                    info.paired = bool(changed["Paired"])
+                    self._mark_dirty("audio")
+
+    def _add_connected_device(self, path: str, mac: str):
+        """Look up a device that connected before we saw it and start tracking it."""
+        try:
+            adapter_name = dbus_path_adapter(path)
+            device = self.bluez.get_device(adapter_name or self.gamepad_adapter, mac)
+            props = device.get_properties()
+            name = str(props.get("Name", props.get("Alias", mac)))
+            icon = str(props.get("Icon", ""))
+            paired = bool(props.get("Paired", False))
+            battery = device.battery
+        except Exception as e:
+            print(f"[BluetoothBridge] Could not look up new device {mac}: {e}")
+            return
+
+        # Both locks (gamepad first): the device must not be added to either dict twice
+        with self._gp_lock, self._audio_lock:
+            if mac in self.discovered_devices or mac in self.audio_devices:
+                return
+
+            if is_gamepad(name, icon):
+                self._mac_to_adapter[mac] = self.gamepad_adapter
+                self.discovered_devices[mac] = DeviceInfo(
+                    mac, name, paired=paired, connected=True,
+                    battery=battery)
+                print(f"[BluetoothBridge] Gamepad connected (new): {name} ({mac})")
+                publish_notification(self.mqtt_client, "bluetooth", "connected",
+                                     "gamepad", f"Controller connected: {name}")
+                self._mark_dirty("gamepads")
+            elif is_audio_device(name, icon):
+                self._mac_to_adapter[mac] = self.audio_adapter
+                self.audio_devices[mac] = DeviceInfo(
+                    mac, name, paired=paired, connected=True,
+                    battery=battery, type="audio")
+                print(f"[BluetoothBridge] Audio device connected (new): {name} ({mac})")
+                self.publish_last_audio_device(mac)
+                publish_notification(self.mqtt_client, "bluetooth", "connected",
+                                     "speaker", f"Speaker connected: {name}")
+                self._mark_dirty("audio")
 
     # ======== MQTT ========
 
@@ -288,67 +409,63 @@ class BluetoothBridge:
         """Initialize MQTT connection and subscriptions."""
         print("[BluetoothBridge] Initializing MQTT...")
 
-        self.mqtt_client = create_mqtt_client(self.config_loader)
+        # Persistent session: the broker keeps our subscriptions across reconnects
+        self.mqtt_client = create_mqtt_client(
+            self.config_loader, client_id="bluetoothbridge", clean_session=False,
+            protocol=mqtt.MQTTv5,
+        )
 
         def on_connect(client, userdata, flags, rc, properties=None):
             print(f"[BluetoothBridge] Connected to MQTT (rc: {rc})")
-            topics = [
-                "protogen/fins/bluetoothbridge/scan/start",
-                "protogen/fins/bluetoothbridge/scan/stop",
-                "protogen/fins/bluetoothbridge/connect",
-                "protogen/fins/bluetoothbridge/disconnect",
-                "protogen/fins/bluetoothbridge/unpair",
-                "protogen/fins/bluetoothbridge/bluetooth/restart",
-                "protogen/fins/bluetoothbridge/forget_disconnected",
-                "protogen/fins/bluetoothbridge/status/last_audio_device",
-                "protogen/fins/config/reload",
-                "protogen/fins/bluetoothbridge/config/reload",
-            ]
-            for topic in topics:
-                client.subscribe(topic)
+            first_connect = not self._mqtt_connected.is_set()
+            self._mqtt_ready = True
+            self._mqtt_connected.set()
+            # Catch up on device list publishes skipped while not ready
+            self._mark_dirty("gamepads")
+            self._mark_dirty("audio")
+            if flags.session_present and not first_connect:
+                return
+            # last_audio_device: never echo our own publishes back (no_local),
+            # and only take the retained value once per process so a
+            # reconnect does not queue another restore
+            last_audio = SubscribeOptions(
+                qos=0, noLocal=True,
+                retainHandling=(SubscribeOptions.RETAIN_SEND_ON_SUBSCRIBE if first_connect
+                                else SubscribeOptions.RETAIN_DO_NOT_SEND),
+            )
+            client.subscribe(
+                [(topic, SubscribeOptions(qos=0)) for topic in _SUBSCRIBE_TOPICS]
+                + [(_LAST_AUDIO_DEVICE_TOPIC, last_audio)]
+            )
 
         def on_message(client, userdata, msg):
-            self.on_mqtt_message(msg.topic, msg.payload.decode("utf-8") if msg.payload else "")
+            # Handlers get raw bytes: _loads parses them directly, and
+            # payload-less commands (scan/start, ...) never decode at all
+            self.on_mqtt_message(msg.topic, msg.payload or b"")
 
         self.mqtt_client.on_connect = on_connect
         self.mqtt_client.on_message = on_message
         self.mqtt_client.loop_start()
 
-        time.sleep(1)
+        if not self._mqtt_connected.wait(timeout=5):
+            print("[BluetoothBridge] MQTT not connected yet, continuing")
 
-    def on_mqtt_message(self, topic: str, payload: str):
+    def on_mqtt_message(self, topic: str, payload: bytes):
         """Handle incoming MQTT messages."""
+        handler = self._handlers.get(topic)
+        if handler is None:
+            return
         try:
-            if topic == "protogen/fins/bluetoothbridge/scan/start":
-                self.start_scan()
-            elif topic == "protogen/fins/bluetoothbridge/scan/stop":
-                self.stop_scan()
-            elif topic == "protogen/fins/bluetoothbridge/connect":
-                data = json.loads(payload)
-                mac = data.get("mac")
-                if mac:
-                    self.connect_device(mac)
-            elif topic == "protogen/fins/bluetoothbridge/disconnect":
-                data = json.loads(payload)
-                mac = data.get("mac")
-                if mac:
-                    self.disconnect_device(mac)
-            elif topic == "protogen/fins/bluetoothbridge/unpair":
-                data = json.loads(payload)
-                mac = data.get("mac")
-                if mac:
-                    self.unpair_device(mac)
-            elif topic == "protogen/fins/bluetoothbridge/bluetooth/restart":
-                self.restart_bluetooth()
-            elif topic == "protogen/fins/bluetoothbridge/forget_disconnected":
-                self.forget_disconnected()
-            elif topic == "protogen/fins/bluetoothbridge/status/last_audio_device":
-                self._restore_last_audio_device(payload)
-            elif topic in ("protogen/fins/config/reload", "protogen/fins/bluetoothbridge/config/reload"):
-                self.handle_config_reload()
+            handler(payload)
         except Exception as e:
             print(f"[BluetoothBridge] Error handling MQTT: {e}")
 
+    def _handle_mac_payload(self, action: Callable[[str], None], payload: bytes):
+        """Parse a {"mac": ...} command payload and run action on it."""
+        mac = _loads(payload).get("mac")
+        if mac:
+            action(normalize_mac(mac))
+
     def handle_config_reload(self):
         """Reload configuration from file."""
         print("[BluetoothBridge] Reloading configuration...")
@@ -363,30 +480,40 @@ class BluetoothBridge:
         print("[BluetoothBridge] Forgetting disconnected devices...")
         to_remove = set()
 
-        with self._state_lock:
+        with self._gp_lock:
             for mac, info in list(self.discovered_devices.items()):
-                if not info.get("connected"):
+                if not info.connected:
                     to_remove.add(mac)
                     del self.discovered_devices[mac]
+                    self._mac_to_adapter.pop(mac, None)
+            self._mark_dirty("gamepads")
 
+        with self._audio_lock:
             for mac, info in list(self.audio_devices.items()):
-                if not info.get("connected"):
+                if not info.connected:
                     to_remove.add(mac)
                     del self.audio_devices[mac]
+                    self._mac_to_adapter.pop(mac, None)
+            self._mark_dirty("audio")
 
-            self.publish_devices_status()
-            self.publish_audio_devices_status()
-
-        # Remove from BlueZ — try all configured adapters
-        adapters = {self.gamepad_adapter, self.audio_adapter}
-        for mac in to_remove:
-            for adapter_name in adapters:
-                try:
-                    adapter = self.bluez.get_adapter(adapter_name)
-                    adapter.remove_device(mac)
-                    print(f"[BluetoothBridge] Removed {mac} from {adapter_name}")
-                except Exception:
-                    pass
+        # Remove from BlueZ on every adapter that actually has the device
+        # (both may, after scanning on both), found with one GetManagedObjects
+        if not to_remove:
+            return
+        adapters = (self.gamepad_adapter, self.audio_adapter)
+        for path, interfaces in self.bluez.get_managed_objects().items():
+            if BLUEZ_DEVICE_IFACE not in interfaces:
+                continue
+            mac = dbus_path_to_mac(path)
+            adapter_name = dbus_path_adapter(path)
+            if mac not in to_remove or adapter_name not in adapters:
+                continue
+            try:
+                self.bluez.get_adapter(adapter_name).remove_device(mac)
+                self.bluez.forget_device(adapter_name, mac)
+                print(f"[BluetoothBridge] Removed {mac} from {adapter_name}")
+            except Exception:
+                pass
 
     # ======== Scanning ========
 
@@ -397,17 +524,19 @@ class BluetoothBridge:
         print("[BluetoothBridge] Starting scan...")
 
         # Discard previous scan results (keep paired/connected devices)
-        with self._state_lock:
+        with self._gp_lock, self._audio_lock:
             self.discovered_devices = {
                 mac: info for mac, info in self.discovered_devices.items()
-                if info.get("paired") or info.get("connected")
+                if info.paired or info.connected
             }
             self.audio_devices = {
                 mac: info for mac, info in self.audio_devices.items()
-                if info.get("paired") or info.get("connected")
+                if info.paired or info.connected
             }
-            self.publish_devices_status()
-            self.publish_audio_devices_status()
+            self._mac_to_adapter = {mac: self.gamepad_adapter for mac in self.discovered_devices}
+            self._mac_to_adapter.update((mac, self.audio_adapter) for mac in self.audio_devices)
+            self._mark_dirty("gamepads")
+            self._mark_dirty("audio")
 
         self.scanning = True
         self.publish_scanning_status()
@@ -451,31 +580,31 @@ class BluetoothBridge:
     # ======== Connect / Disconnect / Unpair ========
 
     def connect_device(self, mac: str):
-        """Connect to a device (runs in background thread)."""
+        """Connect to a device (runs on the worker pool)."""
         self.publish_connection_status(mac, "connecting")
-        threading.Thread(target=self._connect_device_worker, args=(mac,), daemon=True).start()
+        self._submit_device_task(self._connect_device_worker, mac)
 
     def _connect_device_worker(self, mac: str):
-        """Worker thread for connecting a device via D-Bus."""
+        """Pool worker for connecting a device via D-Bus."""
         adapter_name = self._get_adapter_for_device(mac)
         try:
             device = self.bluez.get_device(adapter_name, mac)
+            props = device.get_properties()
 
             # Trust first
-            if not device.trusted:
+            if not props.get("Trusted", False):
                 device.trust()
 
             # BLE devices can't pair while connected — disconnect first
-            if not device.paired and device.connected:
+            if not props.get("Paired", False) and props.get("Connected", False):
                 print(f"[BluetoothBridge] Disconnecting {mac} before pairing...")
                 device.disconnect()
-                time.sleep(1)
+                device.wait_for_connected(False)
 
             # Pair if needed (don't let pair failure block connect)
             if not device.paired:
                 try:
                     device.pair()
-                    time.sleep(1)
                 except Exception as e:
                     print(f"[BluetoothBridge] Pair failed for {mac}, trying connect: {e}")
 
@@ -483,27 +612,21 @@ class BluetoothBridge:
             if not device.connected:
                 device.connect()
 
-            # Update state from actual device properties
-            name = device.name
-            paired = device.paired
-            battery = device.battery
-            with self._state_lock:
-                icon = device.icon
-                if is_audio_device(name, icon):
-                    self.audio_devices[mac] = {
-                        "mac": mac, "name": name,
-                        "paired": paired, "connected": True,
-                        "type": "audio", "battery": battery,
-                    }
-                    self.publish_audio_devices_status()
-                    self.publish_last_audio_device(mac)
-                else:
-                    self.discovered_devices[mac] = {
-                        "mac": mac, "name": name,
-                        "paired": paired, "connected": True,
-                        "battery": battery,
-                    }
-                    self.publish_devices_status()
+            # Update state from actual device properties. If they can't be
+            # read, the connect still succeeded: just flag the tracked entry.
+            try:
+                props = device.get_properties()
+            except GLib.Error as e:
+                print(f"[BluetoothBridge] Could not read {mac} properties after connect: {e}")
+                name = mac
+                self._mark_connected(mac)
+            else:
+                name = str(props.get("Name", props.get("Alias", mac)))
+                paired = bool(props.get("Paired", False))
+                icon = str(props.get("Icon", ""))
+                self._mark_connected(mac, DeviceInfo(
+                    mac, name, paired=paired, connected=True, battery=device.battery,
+                    type="audio" if is_audio_device(name, icon) else "gamepad"))
 
             self.publish_connection_status(mac, "connected")
             print(f"[BluetoothBridge] Connected: {name} ({mac})")
@@ -522,25 +645,49 @@ class BluetoothBridge:
             print(f"[BluetoothBridge] Connection error for {mac}: {e}")
             self.publish_connection_status(mac, "failed", str(e))
 
+    def _mark_connected(self, mac: str, info: Optional[DeviceInfo] = None):
+        """
+        Record a successful connect in the state dicts.
+
+        With info, (re)place the device's entry in the dict matching its
+        type; without, flag whichever entry already tracks mac.
+        """
+        with self._gp_lock:
+            if info is not None and info.type != "audio":
+                self._mac_to_adapter[mac] = self.gamepad_adapter
+                self.discovered_devices[mac] = info
+            if mac in self.discovered_devices:
+                self.discovered_devices[mac].connected = True
+                self._mark_dirty("gamepads")
+        with self._audio_lock:
+            if info is not None and info.type == "audio":
+                self._mac_to_adapter[mac] = self.audio_adapter
+                self.audio_devices[mac] = info
+            if mac in self.audio_devices:
+                self.audio_devices[mac].connected = True
+                self._mark_dirty("audio")
+                self.publish_last_audio_device(mac)
+
     def disconnect_device(self, mac: str):
-        """Disconnect a device (runs in background thread)."""
+        """Disconnect a device (runs on the worker pool)."""
         self.publish_connection_status(mac, "disconnecting")
-        threading.Thread(target=self._disconnect_device_worker, args=(mac,), daemon=True).start()
+        self._submit_device_task(self._disconnect_device_worker, mac)
 
     def _disconnect_device_worker(self, mac: str):
-        """Worker thread for disconnecting a device via D-Bus."""
+        """Pool worker for disconnecting a device via D-Bus."""
         adapter_name = self._get_adapter_for_device(mac)
         try:
             device = self.bluez.get_device(adapter_name, mac)
             device.disconnect()
 
-            with self._state_lock:
+            with self._gp_lock:
                 if mac in self.discovered_devices:
-                    self.discovered_devices[mac]["connected"] = False
-                    self.publish_devices_status()
+                    self.discovered_devices[mac].connected = False
+                    self._mark_dirty("gamepads")
+            with self._audio_lock:
                 if mac in self.audio_devices:
-                    self.audio_devices[mac]["connected"] = False
-                    self.publish_audio_devices_status()
+                    self.audio_devices[mac].connected = False
+                    self._mark_dirty("audio")
 
             self.publish_connection_status(mac, "disconnected")
 
@@ -552,26 +699,23 @@ class BluetoothBridge:
         """Unpair (remove) a device."""
         adapter_name = self._get_adapter_for_device(mac)
         try:
-            # Disconnect first if connected
-            try:
-                device = self.bluez.get_device(adapter_name, mac)
-                if device.connected:
-                    device.disconnect()
-                    time.sleep(0.5)
-            except Exception:
-                pass
-
-            # Remove from adapter
+            # RemoveDevice disconnects the device itself, so go straight to it
+            # and drop the cached device wrapper now rather than waiting for
+            # InterfacesRemoved
             adapter = self.bluez.get_adapter(adapter_name)
             adapter.remove_device(mac)
+            self.bluez.forget_device(adapter_name, mac)
 
-            with self._state_lock:
+            with self._gp_lock:
                 if mac in self.discovered_devices:
                     del self.discovered_devices[mac]
-                    self.publish_devices_status()
+                    self._mac_to_adapter.pop(mac, None)
+                    self._mark_dirty("gamepads")
+            with self._audio_lock:
                 if mac in self.audio_devices:
                     del self.audio_devices[mac]
-                    self.publish_audio_devices_status()
+                    self._mac_to_adapter.pop(mac, None)
+                    self._mark_dirty("audio")
 
             print(f"[BluetoothBridge] Unpaired: {mac}")
             publish_notification(self.mqtt_client, "bluetooth", "unpaired",
@@ -582,11 +726,27 @@ class BluetoothBridge:
 
     # ======== Auto-reconnect ========
 
-    def _load_paired_devices(self):
-        """Load already-paired devices from BlueZ into our state dicts."""
-        for adapter_name in [self.gamepad_adapter, self.audio_adapter]:
+    def _load_paired_devices(self, force: bool = False):
+        """
+        Load already-paired devices from BlueZ into our state dicts.
+
+        This walks GetManagedObjects, which is slow on the Pi: it runs once at
+        startup, after that the D-Bus signal handlers keep the dicts current.
+        Calls within _paired_cache_ttl of the last walk are skipped unless
+        force is set.
+        """
+        now = time.monotonic()
+        if not force and now - self._paired_cache_ts < self._paired_cache_ttl:
+            return
+        self._paired_cache_ts = now
+
+        # One GetManagedObjects call covers both adapters
+        objects = self.bluez.get_managed_objects()
+        for adapter_name in dict.fromkeys([self.gamepad_adapter, self.audio_adapter]):
             try:
-                devices = self.bluez.get_devices_on_adapter(adapter_name, paired_only=True)
+                devices = self.bluez.get_devices_on_adapter(
+                    adapter_name, paired_only=True, objects=objects
+                )
                 for dev in devices:
                     mac = dev["mac"]
                     name = dev["name"]
@@ -595,118 +755,197 @@ class BluetoothBridge:
 
                     battery = dev.get("battery")
                     if is_gamepad(name, icon):
-                        self.discovered_devices[mac] = {
-                            "mac": mac, "name": name,
-                            "paired": True, "connected": connected,
-                            "battery": battery,
-                        }
+                        with self._gp_lock:
+                            self._mac_to_adapter[mac] = self.gamepad_adapter
+                            self.discovered_devices[mac] = DeviceInfo(
+                                mac, name, paired=True, connected=connected,
+                                battery=battery)
                     elif is_audio_device(name, icon):
-                        self.audio_devices[mac] = {
-                            "mac": mac, "name": name,
-                            "paired": True, "connected": connected,
-                            "type": "audio", "battery": battery,
-                        }
+                        with self._audio_lock:
+                            self._mac_to_adapter[mac] = self.audio_adapter
+                            self.audio_devices[mac] = DeviceInfo(
+                                mac, name, paired=True, connected=connected,
+                                battery=battery, type="audio")
             except Exception as e:
                 print(f"[BluetoothBridge] Error loading paired devices from {adapter_name}: {e}")
 
+    def _snapshot_bluez(self) -> Dict[str, Dict]:
+        """{mac: Device1 properties} for devices on our adapters, from one GetManagedObjects call."""
+        adapters = (self.gamepad_adapter, self.audio_adapter)
+        snap = {}
+        for path, interfaces in self.bluez.get_managed_objects().items():
+            props = interfaces.get(BLUEZ_DEVICE_IFACE)
+            if props is None or dbus_path_adapter(path) not in adapters:
+                continue
+            mac = dbus_path_to_mac(path)
+            if mac:
+                snap[mac] = props
+        return snap
+
     def _auto_reconnect_devices(self):
-        """Auto-reconnect to previously connected devices."""
+        """
+        Auto-reconnect to previously connected devices.
+
+        Reconnects are queued on the worker pool and return immediately;
+        the per-adapter lock keeps them from racing each other in BlueZ.
+        """
         print("[BluetoothBridge] Auto-reconnecting...")
 
+        # One GetManagedObjects call answers "already connected?" and
+        # "trusted?" for every device, instead of a D-Bus probe per device
+        snap = self._snapshot_bluez()
         reconnecting = set()
 
+        def reconnect(mac: str):
+            props = snap.get(mac, {})
+            reconnecting.add(mac)
+            self._submit_device_task(
+                functools.partial(self._reconnect_device, trusted=bool(props.get("Trusted"))), mac)
+
+        # Refresh connection state from the snapshot, so devices BlueZ already
+        # has connected are skipped and stale "connected" flags get retried
+        with self._gp_lock, self._audio_lock:
+            for devices in (self.discovered_devices, self.audio_devices):
+                for mac, info in devices.items():
+                    props = snap.get(mac)
+                    if props is not None:
+                        info.connected = bool(props.get("Connected", False))
+
         # Reconnect last audio device from retained message
         if self.last_audio_device_to_restore:
             mac = self.last_audio_device_to_restore["mac"]
             name = self.last_audio_device_to_restore["name"]
 
-            if mac in self.audio_devices and self.audio_devices[mac].get("connected"):
+            with self._audio_lock:
+                info = self.audio_devices.get(mac)
+                already_connected = info is not None and info.connected
+                if info is None:
+                    self._mac_to_adapter[mac] = self.audio_adapter
+                    self.audio_devices[mac] = DeviceInfo(
+                        mac, name, paired=True, type="audio")
+
+            if already_connected:
                 print(f"[BluetoothBridge] Last audio device already connected: {name}")
             else:
-                if mac not in self.audio_devices:
-                    self.audio_devices[mac] = {
-                        "mac": mac, "name": name,
-                        "paired": True, "connected": False, "type": "audio",
-                    }
                 print(f"[BluetoothBridge] Reconnecting last audio device: {name} ({mac})")
-                reconnecting.add(mac)
-                threading.Thread(target=self._reconnect_device, args=(mac,), daemon=True).start()
-                time.sleep(1)
+                reconnect(mac)
 
             self.last_audio_device_to_restore = None
 
+        with self._gp_lock, self._audio_lock:
+            audio_devices = list(self.audio_devices.items())
+            gamepads = list(self.discovered_devices.items())
+
         # Reconnect other paired audio devices
-        for mac, info in list(self.audio_devices.items()):
-            if mac not in reconnecting and info.get("paired") and not info.get("connected"):
-                print(f"[BluetoothBridge] Reconnecting audio: {info.get('name', mac)}")
-                reconnecting.add(mac)
-                threading.Thread(target=self._reconnect_device, args=(mac,), daemon=True).start()
-                time.sleep(1)
+        for mac, info in audio_devices:
+            if mac not in reconnecting and info.paired and not info.connected:
+                print(f"[BluetoothBridge] Reconnecting audio: {info.name}")
+                reconnect(mac)
 
         # Reconnect paired gamepads
-        for mac, info in list(self.discovered_devices.items()):
-            if mac not in reconnecting and info.get("paired") and not info.get("connected"):
-                print(f"[BluetoothBridge] Reconnecting gamepad: {info.get('name', mac)}")
-                reconnecting.add(mac)
-                threading.Thread(target=self._reconnect_device, args=(mac,), daemon=True).start()
-                time.sleep(1)
+        for mac, info in gamepads:
+            if mac not in reconnecting and info.paired and not info.connected:
+                print(f"[BluetoothBridge] Reconnecting gamepad: {info.name}")
+                reconnect(mac)
 
         # Publish status
-        self.publish_devices_status()
-        self.publish_audio_devices_status()
+        self._mark_dirty("gamepads")
+        self._mark_dirty("audio")
 
-    def _reconnect_device(self, mac: str):
-        """Reconnect to an already-paired device."""
+    def _reconnect_device(self, mac: str, trusted: bool = False):
+        """Reconnect to an already-paired device (trusted: Trusted as last seen in BlueZ)."""
         adapter_name = self._get_adapter_for_device(mac)
         try:
             device = self.bluez.get_device(adapter_name, mac)
-            if not device.trusted:
+            if not trusted:
                 device.trust()
             device.connect()
 
             # Update state directly (don't rely on D-Bus signal alone)
-            with self._state_lock:
-                if mac in self.discovered_devices:
-                    self.discovered_devices[mac]["connected"] = True
-                    self.publish_devices_status()
-                if mac in self.audio_devices:
-                    self.audio_devices[mac]["connected"] = True
-                    self.publish_audio_devices_status()
-                    self.publish_last_audio_device(mac)
+            self._mark_connected(mac)
 
             print(f"[BluetoothBridge] Reconnected: {mac}")
         except Exception as e:
             print(f"[BluetoothBridge] Reconnect failed for {mac}: {e}")
 
-    def _restore_last_audio_device(self, payload: str):
+    def _restore_last_audio_device(self, payload: bytes):
         """Store last audio device from retained MQTT for auto-reconnect."""
         try:
             if not payload:
                 return
-            data = json.loads(payload)
+            data = _loads(payload)
             mac = data.get("mac")
+            if not isinstance(mac, str) or not _MAC_ADDR_RE.fullmatch(mac):
+                if mac:
+                    print(f"[BluetoothBridge] Ignoring invalid last audio device MAC: {mac!r}")
+                return
+            mac = normalize_mac(mac)
             name = data.get("name", mac)
-            if mac:
-                self.last_audio_device_to_restore = {"mac": mac, "name": name}
-                print(f"[BluetoothBridge] Will reconnect to: {name} ({mac})")
+            self.last_audio_device_to_restore = {"mac": mac, "name": name}
+            print(f"[BluetoothBridge] Will reconnect to: {name} ({mac})")
         except Exception as e:
             print(f"[BluetoothBridge] Error parsing last audio device: {e}")
 
     # ======== Bluetooth Restart ========
 
+    def _power_cycle_adapters(self) -> bool:
+        """Power cycle the configured adapters over D-Bus. Returns True if all came back up."""
+        ok = True
+        for adapter_name in {self.gamepad_adapter, self.audio_adapter}:
+            try:
+                adapter = self.bluez.get_adapter(adapter_name)
+                adapter.power_off()
+                if not adapter.wait_for_powered(False):
+                    ok = False
+                    continue
+                adapter.power_on()
+                if not adapter.wait_for_powered(True):
+                    ok = False
+            except Exception as e:
+                print(f"[BluetoothBridge] {adapter_name} power cycle failed: {e}")
+                ok = False
+        return ok
+
+    def _reset_bluetooth(self) -> bool:
+        """
+        Reset Bluetooth to a clean state.
+
+        Tries a fast adapter power cycle first, and only falls back to
+        restarting the bluetooth service (hard reset) if that fails.
+        """
+        if self._power_cycle_adapters():
+            print("[BluetoothBridge] Bluetooth adapters power cycled")
+            return True
+
+        print("[BluetoothBridge] Power cycle failed, restarting Bluetooth service...")
+        owner = self.bluez.name_owner()
+        if self.bt_service.restart():
+            self.bluez.forget_adapters()
+            # RestartUnit only queues the job: wait for the new bluetoothd on
+            # the bus, then for its adapters, instead of a fixed sleep
+            if not self.bluez.wait_for_service(owner):
+                print("[BluetoothBridge] Bluetooth service not back on D-Bus yet, continuing")
+                return True
+            for adapter_name in {self.gamepad_adapter, self.audio_adapter}:
+                self.bluez.get_adapter(adapter_name).wait_for_powered(True, timeout=3.0)
+            print("[BluetoothBridge] Bluetooth service restarted")
+            return True
+        return False
+
     def restart_bluetooth(self):
-        """Restart the Bluetooth service to fix errors."""
-        print("[BluetoothBridge] Restarting Bluetooth service...")
+        """Reset Bluetooth to fix errors."""
+        print("[BluetoothBridge] Restarting Bluetooth...")
         try:
             if self.scanning:
                 self.stop_scan()
 
-            if self.bt_service.restart():
-                print("[BluetoothBridge] Bluetooth service restarted")
-                time.sleep(3)
-
-                # Reload paired devices
-                self._load_paired_devices()
+            if self._reset_bluetooth():
+                # Device objects survive a power cycle and a service restart re-announces
+                # them via InterfacesAdded, so only walk GetManagedObjects if nothing is known
+                with self._gp_lock, self._audio_lock:
+                    have_devices = bool(self.discovered_devices or self.audio_devices)
+                if not have_devices:
+                    self._load_paired_devices()
                 self._auto_reconnect_devices()
                 self.publish_all_status()
             else:
@@ -718,42 +957,63 @@ class BluetoothBridge:
     # ======== Status Publishing ========
 
     def publish_scanning_status(self):
+        if not self._mqtt_ready:
+            return
         if self.mqtt_client:
             self.mqtt_client.publish(
                 "protogen/fins/bluetoothbridge/status/scanning",
-                json.dumps(self.scanning), retain=True,
+                _dumps(self.scanning), retain=True,
             )
 
+    @staticmethod
+    def _devices_fingerprint(devices: Dict[str, DeviceInfo]) -> int:
+        """Cheap hash of a device dict, used to skip unchanged retained publishes."""
+        return hash(tuple(astuple(info) for info in devices.values()))
+
     def publish_devices_status(self):
+        if not self._mqtt_ready:
+            return
         if self.mqtt_client:
+            fp = self._devices_fingerprint(self.discovered_devices)
+            if fp == self._last_devices_fp:
+                return
             self.mqtt_client.publish(
                 "protogen/fins/bluetoothbridge/status/devices",
-                json.dumps(list(self.discovered_devices.values())), retain=True,
+                _dumps(list(self.discovered_devices.values())), retain=True,
             )
+            self._last_devices_fp = fp
 
     def publish_audio_devices_status(self):
+        if not self._mqtt_ready:
+            return
         if self.mqtt_client:
+            fp = self._devices_fingerprint(self.audio_devices)
+            if fp == self._last_audio_fp:
+                return
             self.mqtt_client.publish(
                 "protogen/fins/bluetoothbridge/status/audio_devices",
-                json.dumps(list(self.audio_devices.values())), retain=True,
+                _dumps(list(self.audio_devices.values())), retain=True,
             )
+            self._last_audio_fp = fp
 
     def publish_last_audio_device(self, mac: str):
+        if not self._mqtt_ready:
+            return
         if self.mqtt_client and mac in self.audio_devices:
             info = self.audio_devices[mac]
             self.mqtt_client.publish(
-                "protogen/fins/bluetoothbridge/status/last_audio_device",
-                json.dumps({"mac": mac, "name": info.get("name", mac), "timestamp": time.time()}),
+                _LAST_AUDIO_DEVICE_TOPIC,
+                _dumps({"mac": mac, "name": info.name, "timestamp": time.time()}),
                 retain=True,
             )
 
     def publish_connection_status(self, mac: str, status: str, error: str = None):
-        if not self.mqtt_client:
+        if not self._mqtt_ready or not self.mqtt_client:
             return
-        info = self.discovered_devices.get(mac) or self.audio_devices.get(mac, {})
+        info = self.discovered_devices.get(mac) or self.audio_devices.get(mac)
         payload = {
             "mac": mac,
-            "name": info.get("name", mac),
+            "name": info.name if info else mac,
             "status": status,
             "timestamp": time.time(),
         }
@@ -761,67 +1021,111 @@ class BluetoothBridge:
             payload["error"] = error
         self.mqtt_client.publish(
             "protogen/fins/bluetoothbridge/status/connection",
-            json.dumps(payload), retain=False,
+            _dumps(payload), retain=False,
         )
 
+    def _mark_dirty(self, kind: str):
+        """
+        Schedule a device list publish ("gamepads" or "audio").
+
+        Signal bursts (BlueZ restart, reconnect storms) mark the lists dirty
+        many times; they are flushed together at most 50ms later.
+        """
+        with self._publish_lock:
+            self._dirty[kind] = True
+            if self._publish_timer is None:
+                self._publish_timer = threading.Timer(0.05, self._flush_publishes)
+                self._publish_timer.daemon = True
+                self._publish_timer.start()
+
+    def _flush_publishes(self):
+        """Publish the device lists marked dirty since the last flush."""
+        with self._publish_lock:
+            dirty = dict(self._dirty)
+            self._dirty = {kind: False for kind in self._dirty}
+            self._publish_timer = None
+
+        if dirty["gamepads"]:
+            with self._gp_lock:
+                self.publish_devices_status()
+        if dirty["audio"]:
+            with self._audio_lock:
+                self.publish_audio_devices_status()
+
     def publish_all_status(self):
+        # Full refresh: publish even if the lists look unchanged
+        self._last_devices_fp = None
+        self._last_audio_fp = None
         self.publish_scanning_status()
-        self.publish_devices_status()
-        self.publish_audio_devices_status()
+        # Same locks as _flush_publishes: the signal thread mutates the dicts
+        with self._gp_lock:
+            self.publish_devices_status()
+        with self._audio_lock:
+            self.publish_audio_devices_status()
 
     # ======== State Sync ========
 
     def _poll_device_states(self):
         """Periodically sync device states from BlueZ to catch missed signals."""
-        while self.running:
-            time.sleep(5)
+        while not self._stop_event.wait(5):
             try:
                 self._sync_device_states()
             except Exception as e:
                 print(f"[BluetoothBridge] Poll error: {e}")
 
     def _sync_device_states(self):
-        """Query BlueZ for actual device states and update dicts."""
-        changed_gamepads = False
-        changed_audio = False
-
-        with self._state_lock:
-            for mac, info in list(self.discovered_devices.items()):
-                try:
-                    adapter = self._get_adapter_for_device(mac)
-                    device = self.bluez.get_device(adapter, mac)
-                    connected = device.connected
-                    paired = device.paired
-                    battery = device.battery
-                    if (connected != info.get("connected") or paired != info.get("paired")
-                            or battery != info.get("battery")):
-                        info["connected"] = connected
-                        info["paired"] = paired
-                        info["battery"] = battery
-                        changed_gamepads = True
-                except Exception:
-                    pass
-
-            for mac, info in list(self.audio_devices.items()):
-                try:
-                    adapter = self._get_adapter_for_device(mac)
-                    device = self.bluez.get_device(adapter, mac)
-                    connected = device.connected
-                    paired = device.paired
-                    battery = device.battery
-                    if (connected != info.get("connected") or paired != info.get("paired")
-                            or battery != info.get("battery")):
-                        info["connected"] = connected
-                        info["paired"] = paired
-                        info["battery"] = battery
-                        changed_audio = True
-                except Exception:
-                    pass
-
-            if changed_gamepads:
-                self.publish_devices_status()
-            if changed_audio:
-                self.publish_audio_devices_status()
+        """
+        Query BlueZ for actual device states and update dicts.
+
+        All devices are probed concurrently (one GetAll per device, plus
+        Battery1 where sysfs has no reading), outside the state locks.
+        """
+        with self._gp_lock:
+            macs = list(self.discovered_devices)
+        with self._audio_lock:
+            macs += self.audio_devices.keys() - set(macs)
+
+        paths = {mac: mac_to_dbus_path(self._get_adapter_for_device(mac), mac) for mac in macs}
+        batteries = {mac: sysfs_battery(mac) for mac in macs}
+        requests = [(path, BLUEZ_DEVICE_IFACE) for path in paths.values()]
+        requests += [(paths[mac], BLUEZ_BATTERY_IFACE) for mac, b in batteries.items() if b is None]
+        replies = self.bluez.get_all_properties(requests)
+
+        probed = {}  # {mac: (connected, paired, battery)}
+        for mac, path in paths.items():
+            props = replies.get((path, BLUEZ_DEVICE_IFACE))
+            if props is None:
+                continue  # GetAll failed or timed out: keep the known state
+            battery = batteries[mac]
+            if battery is None:
+                batt_props = replies.get((path, BLUEZ_BATTERY_IFACE)) or {}
+                if "Percentage" in batt_props:
+                    battery = int(batt_props["Percentage"])
+            probed[mac] = (bool(props.get("Connected", False)),
+                           bool(props.get("Paired", False)), battery)
+
+        def apply(devices: Dict[str, DeviceInfo]) -> bool:
+            changed = False
+            for mac, info in devices.items():
+                state = probed.get(mac)
+                if state is None:
+                    continue  # Added since the probe
+                connected, paired, battery = state
+                if (connected != info.connected or paired != info.paired
+                        or battery != info.battery):
+                    info.connected = connected
+                    info.paired = paired
+                    info.battery = battery
+                    changed = True
+            return changed
+
+        with self._gp_lock:
+            if apply(self.discovered_devices):
+                self._mark_dirty("gamepads")
+
+        with self._audio_lock:
+            if apply(self.audio_devices):
+                self._mark_dirty("audio")
 
     # ======== Lifecycle ========
 
@@ -829,7 +1133,9 @@ class BluetoothBridge:
         """Clean up all resources."""
         print("[BluetoothBridge] Cleaning up...")
         self.stop_scan()
+        self._pool.shutdown(wait=False, cancel_futures=True)
         self.bluez.stop()
+        self._mqtt_ready = False
         if self.mqtt_client:
             self.mqtt_client.loop_stop()
             self.mqtt_client.disconnect()
@@ -847,17 +1153,17 @@ class BluetoothBridge:
         # Subscribe to D-Bus signals FIRST so we catch everything during startup
         self.bluez.subscribe_interfaces_added(self._on_interfaces_added)
         self.bluez.subscribe_interfaces_removed(self._on_interfaces_removed)
-        self.bluez.subscribe_properties_changed(self._on_properties_changed)
+        # One arg0-filtered match rule per interface we care about
+        self.bluez.subscribe_properties_changed(self._on_properties_changed, BLUEZ_DEVICE_IFACE)
+        self.bluez.subscribe_properties_changed(self._on_properties_changed, BLUEZ_BATTERY_IFACE)
         self.bluez.start()
 
         # Initialize MQTT (needed before publish calls in signal handlers)
         self.init_mqtt()
 
-        # Restart Bluetooth for clean state
+        # Reset Bluetooth for clean state
         try:
-            if self.bt_service.restart():
-                print("[BluetoothBridge] Bluetooth service restarted")
-                time.sleep(3)
+            self._reset_bluetooth()
         except Exception as e:
             print(f"[BluetoothBridge] Bluetooth restart warning: {e}")
 
@@ -866,9 +1172,14 @@ class BluetoothBridge:
 
         # Unblock and power on adapters via D-Bus
         try:
-            subprocess.run(["sudo", "rfkill", "unblock", "bluetooth"],
-                           capture_output=True, timeout=5)
-            time.sleep(0.5)
+            try:
+                rfkill_unblock_bluetooth()
+            except OSError as e:
+                # No write access to /dev/rfkill: fall back to the rfkill CLI
+                print(f"[BluetoothBridge] /dev/rfkill unavailable ({e}), using rfkill")
+                subprocess.run(["sudo", "rfkill", "unblock", "bluetooth"],
+                               capture_output=True, timeout=5)
+                time.sleep(0.5)
 
             for adapter_name in [self.gamepad_adapter, self.audio_adapter]:
                 try:
@@ -881,7 +1192,7 @@ class BluetoothBridge:
             print(f"[BluetoothBridge] Adapter setup warning: {e}")
 
         # Snapshot paired devices now that adapters are up
-        self._load_paired_devices()
+        self._load_paired_devices(force=True)
 
         # Auto-reconnect
         self._auto_reconnect_devices()
@@ -895,8 +1206,7 @@ class BluetoothBridge:
         print("[BluetoothBridge] Running. Press Ctrl+C to exit.")
 
         try:
-            while self.running:
-                time.sleep(1)
+            self._stop_event.wait()
         except KeyboardInterrupt:
             pass
 
@@ -905,6 +1215,7 @@ class BluetoothBridge:
     def _signal_handler(self, signum, frame):
         print(f"\n[BluetoothBridge] Signal {signum}, shutting down...")
         self.running = False
+        self._stop_event.set()
 
 
 def main():
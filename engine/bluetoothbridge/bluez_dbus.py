@@ -4,8 +4,13 @@ Provides Pythonic access to BlueZ Bluetooth management via pydbus.
 Replaces all bluetoothctl subprocess calls with direct D-Bus API.
 """
 
+import functools
 import glob
+import re
+import struct
+import sys
 import threading
+import time
 import logging
 from typing import Optional, Callable, Dict, List
 
@@ -87,28 +92,43 @@ AUDIO_KEYWORDS = [
     "soundcore", "anker", "marshall", "harman", "bang",
 ]
 
+# One alternation per category: a single C-level scan per name instead of
+# a Python loop over every keyword
+_GAMEPAD_RE = re.compile("|".join(map(re.escape, GAMEPAD_KEYWORDS)), re.IGNORECASE)
+_AUDIO_RE = re.compile("|".join(map(re.escape, AUDIO_KEYWORDS)), re.IGNORECASE)
+
 
 def is_gamepad(name: str, icon: str = "") -> bool:
     """Check if a device is a gamepad based on name and BlueZ icon property."""
     if not name:
         return False
-    name_lower = name.lower()
     if icon and icon == "input-gaming":
         return True
-    return any(kw in name_lower for kw in GAMEPAD_KEYWORDS)
+    return _GAMEPAD_RE.search(name) is not None
 
 
 def is_audio_device(name: str, icon: str = "") -> bool:
     """Check if a device is an audio device based on name and BlueZ icon property."""
     if not name:
         return False
-    # Gamepads take priority — some controllers have "audio" in metadata
-    if is_gamepad(name, icon):
+    if icon not in ("audio-card", "audio-headphones", "audio-headset") \
+            and _AUDIO_RE.search(name) is None:
         return False
-    name_lower = name.lower()
-    if icon and icon in ("audio-card", "audio-headphones", "audio-headset"):
-        return True
-    return any(kw in name_lower for kw in AUDIO_KEYWORDS)
+    # Gamepads take priority — some controllers have "audio" in metadata.
+    # Only checked on an audio match, most names match neither.
+    return not is_gamepad(name, icon)
+
+
+def sysfs_battery(mac: str) -> Optional[int]:
+    """Battery percentage from power_supply sysfs (DS4/DualSense controllers), or None."""
+    matches = glob.glob(f"/sys/class/power_supply/*{mac.lower()}*/capacity")
+    if matches:
+        try:
+            with open(matches[0]) as f:
+                return int(f.read().strip())
+        except Exception:
+            pass
+    return None
 
 
 def mac_to_dbus_path(adapter: str, mac: str) -> str:
@@ -116,16 +136,32 @@ def mac_to_dbus_path(adapter: str, mac: str) -> str:
     return f"/org/bluez/{adapter}/dev_{mac.replace(':', '_')}"
 
 
+_MAC_RE = re.compile(r"/dev_([0-9A-Fa-f_]{17})(?:/|$)")
+# Upper-case hex digits and turn path underscores into colons in one pass
+_MAC_NORMALIZE = str.maketrans("abcdef_", "ABCDEF:")
+
+
+def normalize_mac(mac: str) -> str:
+    """Return the canonical AA:BB:CC:DD:EE:FF form of a MAC, interned.
+
+    Interned MACs make the state dict keys shared objects, so lookups hit
+    the identity fast path.
+    """
+    return sys.intern(mac.translate(_MAC_NORMALIZE))
+
+
+# Signal handlers call these for every event on a small set of repeating paths
+@functools.lru_cache(maxsize=1024)
 def dbus_path_to_mac(path: str) -> Optional[str]:
     """Extract MAC address from BlueZ D-Bus object path."""
     # /org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF → AA:BB:CC:DD:EE:FF
-    parts = path.split("/")
-    for part in parts:
-        if part.startswith("dev_"):
-            return part[4:].replace("_", ":")
+    match = _MAC_RE.search(path)
+    if match:
+        return normalize_mac(match.group(1))
     return None
 
 
+@functools.lru_cache(maxsize=1024)
 def dbus_path_adapter(path: str) -> Optional[str]:
     """Extract adapter name from BlueZ D-Bus object path."""
     # /org/bluez/hci0/dev_... → hci0
@@ -135,6 +171,23 @@ def dbus_path_adapter(path: str) -> Optional[str]:
     return None
 
 
+# /dev/rfkill event: __u32 idx, __u8 type, __u8 op, __u8 soft, __u8 hard
+RFKILL_DEVICE = "/dev/rfkill"
+RFKILL_TYPE_BLUETOOTH = 2
+RFKILL_OP_CHANGE_ALL = 3
+
+
+def rfkill_unblock_bluetooth():
+    """
+    Soft-unblock all Bluetooth radios by writing a CHANGE_ALL event to
+    /dev/rfkill (same as `rfkill unblock bluetooth`, without the fork).
+    Raises OSError if /dev/rfkill is missing or not writable.
+    """
+    event = struct.pack("=IBBBB", 0, RFKILL_TYPE_BLUETOOTH, RFKILL_OP_CHANGE_ALL, 0, 0)
+    with open(RFKILL_DEVICE, "wb", buffering=0) as f:
+        f.write(event)
+
+
 class BluezAdapter:
     """Wrapper around a BlueZ Bluetooth adapter via D-Bus."""
 
@@ -143,6 +196,7 @@ class BluezAdapter:
         self.name = adapter_name
         self.path = f"/org/bluez/{adapter_name}"
         self._proxy = None
+        self._address: Optional[str] = None
 
     def _get_proxy(self):
         """Get or refresh the adapter D-Bus proxy."""
@@ -156,8 +210,10 @@ class BluezAdapter:
 
     @property
     def address(self) -> str:
-        """Get adapter Bluetooth address (MAC)."""
-        return self._get_proxy().Address
+        """Get adapter Bluetooth address (MAC), cached after the first read."""
+        if self._address is None:
+            self._address = str(self._get_proxy().Address)
+        return self._address
 
     @property
     def powered(self) -> bool:
@@ -177,6 +233,18 @@ class BluezAdapter:
             proxy.Powered = False
             logger.info(f"[{self.name}] Powered off")
 
+    def wait_for_powered(self, value: bool, timeout: float = 2.0) -> bool:
+        """Wait until the adapter's Powered property equals value. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                if self._get_proxy().Powered == value:
+                    return True
+            except Exception:
+                pass
+            time.sleep(0.05)
+        return False
+
     def start_discovery(self):
         """Start Bluetooth device discovery (scanning)."""
         try:
@@ -238,6 +306,23 @@ class BluezDevice:
                 raise
         return self._proxy
 
+    def get_properties(self) -> Dict:
+        """
+        Fetch all Device1 properties in a single D-Bus round-trip.
+
+        Reading several pydbus proxy attributes costs one Get call each;
+        prefer this when more than one property is needed.
+        Raises GLib.Error if the call fails (timeout, bluetoothd restarting,
+        device unknown to BlueZ), so callers never mistake a failed read
+        for a disconnected, unpaired device.
+        """
+        result = self.bus.con.call_sync(
+            BLUEZ_SERVICE, self.path, PROPERTIES_IFACE, "GetAll",
+            GLib.Variant("(s)", (BLUEZ_DEVICE_IFACE,)),
+            GLib.VariantType("(a{sv})"), Gio.DBusCallFlags.NONE, -1, None,
+        )
+        return result[0]
+
     @property
     def name(self) -> str:
         try:
@@ -282,14 +367,9 @@ class BluezDevice:
     def battery(self) -> Optional[int]:
         """Battery percentage (0-100) via power_supply sysfs or BlueZ Battery1."""
         # Try power_supply sysfs first (used by DS4/DualSense controllers)
-        mac_lower = self.mac.lower().replace(":", ":")
-        matches = glob.glob(f"/sys/class/power_supply/*{mac_lower}*/capacity")
-        if matches:
-            try:
-                with open(matches[0]) as f:
-                    return int(f.read().strip())
-            except Exception:
-                pass
+        battery = sysfs_battery(self.mac)
+        if battery is not None:
+            return battery
         # Fall back to BlueZ Battery1 D-Bus interface
         try:
             props = self.bus.con.call_sync(
@@ -332,6 +412,15 @@ class BluezDevice:
         self._get_proxy().Disconnect()
         logger.info(f"[{self.mac}] Disconnected")
 
+    def wait_for_connected(self, value: bool, timeout: float = 2.0) -> bool:
+        """Wait until the device's Connected property equals value. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.connected == value:
+                return True
+            time.sleep(0.05)
+        return False
+
 
 class BluezManager:
     """
@@ -347,6 +436,8 @@ class BluezManager:
         self._loop_thread: Optional[threading.Thread] = None
         self._subscriptions: List = []
         self._adapters: Dict[str, BluezAdapter] = {}
+        self._devices: Dict[tuple, BluezDevice] = {}  # (adapter_name, mac) → wrapper
+        self._devices_lock = threading.Lock()
         self._agent_reg_id = None
 
     def register_agent(self):
@@ -372,8 +463,100 @@ class BluezManager:
         return self._adapters[name]
 
     def get_device(self, adapter_name: str, mac: str) -> BluezDevice:
-        """Create a device wrapper."""
-        return BluezDevice(self.bus, adapter_name, mac)
+        """
+        Get or create a device wrapper.
+
+        Wrappers (and their introspected proxies) are cached until the device
+        is removed from BlueZ, see forget_device().
+        """
+        key = (adapter_name, mac)
+        with self._devices_lock:
+            device = self._devices.get(key)
+            if device is None:
+                device = BluezDevice(self.bus, adapter_name, mac)
+                self._devices[key] = device
+            return device
+
+    def forget_device(self, adapter_name: str, mac: str):
+        """Drop a cached device wrapper (call when BlueZ removes the object)."""
+        with self._devices_lock:
+            self._devices.pop((adapter_name, mac), None)
+
+    def forget_adapters(self):
+        """Drop cached adapter wrappers (proxy, address) after a bluetoothd restart."""
+        self._adapters.clear()
+
+    def get_all_properties(self, requests) -> Dict[tuple, Optional[Dict]]:
+        """
+        Properties.GetAll for many (path, interface) pairs, all in flight at once.
+
+        The calls are issued asynchronously on a private main context and
+        this blocks until every reply (or error) is in, so N lookups cost
+        about one round-trip instead of N. Failed lookups, invalid paths and
+        calls with no reply by the deadline map to None.
+        """
+        requests = list(dict.fromkeys(requests))
+        results: Dict[tuple, Optional[Dict]] = {}
+        if not requests:
+            return results
+        for key in requests:
+            if not GLib.Variant.is_object_path(key[0]):
+                results[key] = None
+        pending = [key for key in requests if key not in results]
+
+        def on_reply(con, res, key):
+            try:
+                results[key] = con.call_finish(res)[0]
+            except Exception:
+                results[key] = None
+
+        context = GLib.MainContext()
+        context.push_thread_default()
+        try:
+            for path, interface in pending:
+                self.bus.con.call(
+                    BLUEZ_SERVICE, path, PROPERTIES_IFACE, "GetAll",
+                    GLib.Variant("(s)", (interface,)),
+                    GLib.VariantType("(a{sv})"), Gio.DBusCallFlags.NONE, 5000, None,
+                    on_reply, (path, interface),
+                )
+            # Bounded: a call rejected up front never runs its callback
+            deadline = time.monotonic() + 5.5
+            while len(results) < len(requests) and time.monotonic() < deadline:
+                if not context.iteration(False):
+                    time.sleep(0.005)
+        finally:
+            context.pop_thread_default()
+        for key in pending:
+            results.setdefault(key, None)
+        return results
+
+    def name_owner(self) -> Optional[str]:
+        """Unique bus name of the bluetoothd currently owning org.bluez, or None."""
+        try:
+            reply = self.bus.con.call_sync(
+                "org.freedesktop.DBus", "/org/freedesktop/DBus", "org.freedesktop.DBus",
+                "GetNameOwner", GLib.Variant("(s)", (BLUEZ_SERVICE,)),
+                GLib.VariantType("(s)"), Gio.DBusCallFlags.NONE, -1, None,
+            )
+            return reply[0]
+        except GLib.Error:
+            return None
+
+    def wait_for_service(self, previous_owner: Optional[str] = None, timeout: float = 10.0) -> bool:
+        """
+        Wait until org.bluez has an owner other than previous_owner.
+
+        Pass name_owner() from before a restart so the old bluetoothd,
+        still shutting down, doesn't count. Returns False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            owner = self.name_owner()
+            if owner and owner != previous_owner:
+                return True
+            time.sleep(0.05)
+        return False
 
     def get_managed_objects(self) -> Dict:
         """Get all BlueZ managed objects from ObjectManager."""
@@ -385,13 +568,18 @@ class BluezManager:
             return {}
 
     def get_devices_on_adapter(self, adapter_name: str, paired_only: bool = False,
-                                connected_only: bool = False) -> List[Dict]:
+                                connected_only: bool = False,
+                                objects: Optional[Dict] = None) -> List[Dict]:
         """
         Get devices on a specific adapter by querying ObjectManager.
 
+        Pass objects (a get_managed_objects() result) to reuse one
+        GetManagedObjects call across several adapters.
+
         Returns list of dicts with: mac, name, paired, connected, trusted, icon, path
         """
-        objects = self.get_managed_objects()
+        if objects is None:
+            objects = self.get_managed_objects()
         adapter_prefix = f"/org/bluez/{adapter_name}/dev_"
         devices = []
 
@@ -417,15 +605,7 @@ class BluezManager:
                 if "Percentage" in batt_props:
                     battery = int(batt_props["Percentage"])
             if battery is None:
-                # Try power_supply sysfs (DS4/DualSense controllers)
-                mac_lower = mac.lower()
-                sysfs_matches = glob.glob(f"/sys/class/power_supply/*{mac_lower}*/capacity")
-                if sysfs_matches:
-                    try:
-                        with open(sysfs_matches[0]) as f:
-                            battery = int(f.read().strip())
-                    except Exception:
-                        pass
+                battery = sysfs_battery(mac)
             devices.append({
                 "mac": mac,
                 "name": str(props.get("Name", props.get("Alias", mac))),
@@ -468,13 +648,17 @@ class BluezManager:
         except Exception as e:
             logger.error(f"Failed to subscribe InterfacesRemoved: {e}")
 
-    def subscribe_properties_changed(self, callback: Callable):
+    def subscribe_properties_changed(self, callback: Callable, interface: Optional[str] = None):
         """
         Subscribe to PropertiesChanged signal on all BlueZ objects.
 
         callback(sender, obj, iface, signal, params) — raw signal handler.
         params is (interface_name, changed_properties, invalidated_properties).
 
+        interface: only deliver changes for this interface (e.g. Device1).
+        The filter is an arg0 match rule evaluated by the bus daemon, so
+        other interfaces never wake up the Python side.
+
         Use this to detect connection state changes, name updates, etc.
         """
         try:
@@ -483,12 +667,12 @@ class BluezManager:
                 PROPERTIES_IFACE,       # interface
                 "PropertiesChanged",    # signal name
                 None,                   # object path (None = all)
-                None,                   # arg0 filter
+                interface,              # arg0 filter (None = any interface)
                 0,                      # flags
                 callback,
             )
             self._subscriptions.append(("PropertiesChanged", sub))
-            logger.debug("Subscribed to PropertiesChanged")
+            logger.debug(f"Subscribed to PropertiesChanged ({interface or 'all'})")
         except Exception as e:
             logger.error(f"Failed to subscribe PropertiesChanged: {e}")
 
@@ -526,4 +710,6 @@ class BluezManager:
             self._loop_thread = None
 
         self._adapters.clear()
+        with self._devices_lock:
+            self._devices.clear()
         logger.info("BluezManager stopped")
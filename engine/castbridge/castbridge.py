@@ -34,6 +34,31 @@ logger = get_logger("castbridge")
 SHAIRPORT_CONFIG_PATH = "/etc/shairport-sync.conf"
 SPOTIFYD_CONFIG_PATH = "/etc/spotifyd.conf"
 
+# name = "DeviceName"; in shairport-sync.conf
+_SHAIRPORT_NAME_RE = re.compile(r'name\s*=\s*"([^"]*)"')
+# Track metadata JSON embedded in the Spotify embed page
+_NEXT_DATA_RE = re.compile(r'<script id="__NEXT_DATA__" type="application/json">(.+?)</script>')
+
+
+def _strip_csi(text: str) -> str:
+    """Remove ANSI CSI sequences (ESC [ ... final byte) such as color codes."""
+    if "\x1b" not in text:
+        return text
+    out = []
+    i = 0
+    n = len(text)
+    while True:
+        start = text.find("\x1b[", i)
+        if start < 0:
+            out.append(text[i:])
+            return "".join(out)
+        out.append(text[i:start])
+        # Skip parameter/intermediate bytes up to the final byte (@ to ~)
+        i = start + 2
+        while i < n and not "@" <= text[i] <= "~":
+            i += 1
+        i += 1
+
 
 @dataclass
 class AirPlayStatus:
@@ -153,7 +178,7 @@ class CastBridge:
             return
 
         # Extract name from: name = "DeviceName";
-        match = re.search(r'name\s*=\s*"([^"]*)"', content)
+        match = _SHAIRPORT_NAME_RE.search(content)
         if match:
             self.airplay_status.device_name = match.group(1)
 
@@ -796,10 +821,7 @@ sessioncontrol = {{
                 html = resp.read().decode("utf-8", errors="replace")
 
             # Extract __NEXT_DATA__ JSON
-            match = re.search(
-                r'<script id="__NEXT_DATA__" type="application/json">(.+?)</script>',
-                html,
-            )
+            match = _NEXT_DATA_RE.search(html)
             if not match:
                 logger.warning(f"No __NEXT_DATA__ found for track {track_id}")
                 return None
@@ -1326,8 +1348,13 @@ sessioncontrol = {{
         topic = f"protogen/fins/castbridge/status/{service}/logs"
 
         def on_log_entry(entry):
+            message = entry.get("MESSAGE", "")
+            if isinstance(message, list):
+                # journalctl encodes messages with control characters
+                # (e.g. colored output) as byte arrays
+                message = bytes(message).decode("utf-8", "replace")
             log_msg = {
-                "message": entry.get("MESSAGE", ""),
+                "message": _strip_csi(message),
                 "priority": int(entry.get("PRIORITY", 6)),
                 "timestamp": entry.get("__REALTIME_TIMESTAMP", ""),
                 "pid": entry.get("_PID", ""),
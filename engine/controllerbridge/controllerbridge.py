@@ -5,12 +5,18 @@ Monitors Bluetooth gamepad connections, reads evdev input, and forwards to launc
 
 import paho.mqtt.client as mqtt
 import signal
+import ctypes
+import hashlib
 import json
-import select
+import queue
+import selectors
+import struct
 import threading
 import time
+import traceback
 import sys
 import os
+from collections import deque
 from typing import Optional, Dict
 
 # Add project root to path
@@ -24,6 +30,13 @@ from utils.notifications import publish_notification
 try:
     import evdev
     from evdev import InputDevice, ecodes
+    # Face buttons that mark a gamepad (BTN_SOUTH and BTN_GAMEPAD alias 0x130 today)
+    _GAMEPAD_BUTTONS = frozenset((ecodes.BTN_SOUTH, ecodes.BTN_GAMEPAD))
+    # {key code: (name, *aliases)}: ecodes.BTN mixes plain names and alias tuples
+    _BTN_NAMES = {code: (names,) if isinstance(names, str) else tuple(names)
+                  for code, names in ecodes.BTN.items()}
+    # Axes the input loop acts on; analog stick motion (the bulk of events) is dropped on read
+    _HANDLED_ABS = frozenset((ecodes.ABS_HAT0X, ecodes.ABS_HAT0Y, ecodes.ABS_Z, ecodes.ABS_RZ))
     EVDEV_AVAILABLE = True
 except ImportError as e:
     EVDEV_AVAILABLE = False
@@ -33,6 +46,45 @@ except Exception as e:
     EVDEV_AVAILABLE = False
     print(f"[ControllerBridge] Error loading evdev: {e}")
 
+# inotify on /dev/input, to notice new evdev nodes without sleep-polling
+try:
+    _libc = ctypes.CDLL(None, use_errno=True)
+    _inotify_init1 = _libc.inotify_init1
+    _inotify_add_watch = _libc.inotify_add_watch
+    INOTIFY_AVAILABLE = True
+except (OSError, AttributeError):
+    INOTIFY_AVAILABLE = False
+
+_IN_ATTRIB = 0x00000004  # udev fixes node permissions after creation
+_IN_CREATE = 0x00000100
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (name follows)
+
+# MQTT payload encoding: orjson (bytes, C speed) on the input hot path
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    # Compact like orjson: no spaces after separators
+    _JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+    def _dumps(obj) -> bytes:
+        return _JSON_ENCODER.encode(obj).encode()
+
+
+class _InputReader:
+    """Per-gamepad read state, registered as selector data on the input thread."""
+
+    def __init__(self, mac: str, device):
+        self.mac = mac
+        self.device = device
+        self.dpad_x_state = 0
+        self.dpad_y_state = 0
+        self.was_assigned = False
+        self.pressed_buttons = set()  # Raw button names for combo detection
+        self.first_read = True  # Discard first batch of buffered events
+
 
 class ControllerBridge:
     """
@@ -48,7 +100,8 @@ class ControllerBridge:
 
     Publishes:
         - protogen/fins/controllerbridge/status/assignments
-        - protogen/fins/launcher/input/exec
+        - protogen/fins/launcher/input/exec  (single event)
+        - protogen/fins/launcher/input/exec_batch  (all events from one read)
         - protogen/global/notifications
     """
 
@@ -61,13 +114,42 @@ class ControllerBridge:
         self.known_devices: Dict[str, Dict] = {}      # {mac: {name, connected}} from bluetoothbridge
         self.connected_devices: Dict[str, Dict] = {}   # {mac: {name, evdev_path}}
         self.assignments: Dict[str, Optional[str]] = {"left": None, "right": None, "presets": None}
+        # Reverse index {mac: slot}, rebuilt by _reindex_assignments() on every write above
+        self._slot_by_mac: Dict[str, str] = {}
+        # Serializes assignment writes (MQTT thread vs. combos on the input thread);
+        # readers use the _slot_by_mac snapshot lock-free
+        self._assign_lock = threading.Lock()
+
+        # Connect/disconnect handling runs in order on one persistent worker,
+        # off the MQTT thread (evdev discovery can take seconds)
+        self._device_queue: "queue.Queue" = queue.Queue()
+        self._device_thread: Optional[threading.Thread] = None
+        self._pending_connect: set = set()  # Queued/in-progress connects
+        self._evdev_by_mac: Dict[str, str] = {}  # Last evdev node found per MAC
 
         # Input reading threads
-        self.input_threads: Dict[str, threading.Thread] = {}
-        self.input_stop_events: Dict[str, threading.Event] = {}
-
-        # Button mapping
+        # One thread reads every gamepad: fds are multiplexed on a single selector
+        self.input_readers: Dict[str, _InputReader] = {}
+        self._input_selector = selectors.DefaultSelector()
+        # Written on shutdown to wake the worker out of select()
+        self._input_wakeup = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        self._input_selector.register(self._input_wakeup, selectors.EVENT_READ, None)
+        self._input_lock = threading.Lock()  # input_readers + selector registration
+        self._input_thread: Optional[threading.Thread] = None
+
+        # Coalesced status publishes (see _mark_dirty)
+        self._status_dirty: set = set()
+        self._publish_lock = threading.Lock()
+        self._publish_timer: Optional[threading.Timer] = None
+        self._last_status_hash: Dict[str, bytes] = {}  # {topic: digest} of last retained payload
+
+        # Startup barriers: broker connected / retained assignments received
+        self._connected_event = threading.Event()
+        self._retained_event = threading.Event()
+
+        # Button mapping, and the same resolved per key code for the input loop
         self.button_mapping = self._load_button_mapping()
+        self._key_by_code = self._resolve_button_mapping()
 
         # Preset combo detection
         self.preset_combos: Dict = {}       # {frozenset(btn_names): preset_name}
@@ -105,6 +187,18 @@ class ControllerBridge:
             "ABS_HAT0Y": "dpad_y",
         }
 
+    def _resolve_button_mapping(self) -> Dict[int, str]:
+        """{evdev key code: mapped key} for every BTN code whose name or alias is mapped."""
+        if not EVDEV_AVAILABLE:
+            return {}
+        key_by_code = {}
+        for code, names in _BTN_NAMES.items():
+            for name in names:
+                if name in self.button_mapping:
+                    key_by_code[code] = self.button_mapping[name]
+                    break
+        return key_by_code
+
     def _load_assignment_config(self):
         """Load assignment combo keys and LED colors from config."""
         try:
@@ -196,6 +290,8 @@ class ControllerBridge:
         def on_connect(client, userdata, flags, rc, properties=None):
             if rc == 0:
                 print("[ControllerBridge] Connected to MQTT broker")
+                # The broker may have lost our retained status, republish on next change
+                self._last_status_hash.clear()
                 client.subscribe("protogen/fins/bluetoothbridge/status/devices")
                 client.subscribe("protogen/fins/controllerbridge/assign")
                 client.subscribe("protogen/fins/controllerbridge/status/assignments")
@@ -213,6 +309,7 @@ class ControllerBridge:
                 client.subscribe("protogen/fins/castbridge/status/spotify/health")
                 client.subscribe("protogen/fins/networkingbridge/status/ap")
                 client.subscribe("protogen/fins/audiobridge/status/volume")
+                self._connected_event.set()
             else:
                 print(f"[ControllerBridge] Failed to connect to MQTT: {rc}")
 
@@ -224,8 +321,11 @@ class ControllerBridge:
         self.mqtt_client.on_message = on_message
         self.mqtt_client.loop_start()
 
-        # Wait briefly for retained assignments
-        time.sleep(0.5)
+        # Wait for the connection, then briefly for retained assignments
+        if not self._connected_event.wait(timeout=5):
+            print("[ControllerBridge] MQTT not connected yet, continuing")
+        else:
+            self._retained_event.wait(timeout=1.0)
 
         # Combos, colors, and action combos all restored from retained MQTT messages.
         # Config.yaml provides defaults (loaded in __init__), overridden by retained msgs.
@@ -265,14 +365,14 @@ class ControllerBridge:
                 self.handle_config_reload()
         except Exception as e:
             print(f"[ControllerBridge] Error handling {topic}: {e}")
-            import traceback
             traceback.print_exc()
 
     def handle_config_reload(self):
         """Reload configuration from file."""
         print("[ControllerBridge] Reloading configuration...")
         self.config_loader.reload()
-        self._load_button_mapping()
+        self.button_mapping = self._load_button_mapping()
+        self._key_by_code = self._resolve_button_mapping()
         print("[ControllerBridge] Configuration reloaded")
 
     # ======== Device Tracking ========
@@ -281,35 +381,51 @@ class ControllerBridge:
         """Handle gamepad device list updates from bluetoothbridge."""
         try:
             devices = json.loads(payload)
-            current_macs = set()
+            names = {}
+            now_connected = set()
 
             for device in devices:
                 mac = device.get("mac")
-                name = device.get("name", mac)
-                connected = device.get("connected", False)
-                current_macs.add(mac)
-
-                was_connected = mac in self.connected_devices
-
-                if connected and not was_connected:
-                    # New connection — find evdev and start reading
-                    self.known_devices[mac] = {"name": name, "connected": True}
-                    self._handle_controller_connected(mac, name)
-                elif not connected and was_connected:
-                    # Disconnected
-                    self._handle_controller_disconnected(mac, name)
-                    if mac in self.known_devices:
-                        self.known_devices[mac]["connected"] = False
-
-            # Handle devices that disappeared entirely (unpaired)
-            for mac in list(self.connected_devices.keys()):
-                if mac not in current_macs:
-                    name = self.connected_devices[mac].get("name", mac)
-                    self._handle_controller_disconnected(mac, name)
+                names[mac] = device.get("name", mac)
+                if device.get("connected", False):
+                    now_connected.add(mac)
+
+            # Both are mutated by the device worker: iterate snapshots
+            was_connected = set(list(self.connected_devices)) | set(list(self._pending_connect))
+
+            for mac in now_connected - was_connected:
+                # New connection — find evdev and start reading
+                self.known_devices[mac] = {"name": names[mac], "connected": True}
+                self._pending_connect.add(mac)
+                self._device_queue.put((self._connect_task, (mac, names[mac])))
+
+            # Disconnected, or disappeared entirely (unpaired)
+            for mac in was_connected - now_connected:
+                name = names.get(mac) or self.connected_devices.get(mac, {}).get("name", mac)
+                self._device_queue.put((self._handle_controller_disconnected, (mac, name)))
+                if mac in self.known_devices:
+                    self.known_devices[mac]["connected"] = False
 
         except Exception as e:
             print(f"[ControllerBridge] Error handling devices update: {e}")
 
+    def _device_worker(self):
+        """Persistent worker running queued connect/disconnect handlers in order."""
+        while True:
+            task, args = self._device_queue.get()
+            if task is None:
+                break
+            try:
+                task(*args)
+            except Exception as e:
+                print(f"[ControllerBridge] Device task error: {e}")
+
+    def _connect_task(self, mac: str, name: str):
+        try:
+            self._handle_controller_connected(mac, name)
+        finally:
+            self._pending_connect.discard(mac)
+
     def _handle_controller_connected(self, mac: str, name: str):
         """Handle a gamepad connecting."""
         if not EVDEV_AVAILABLE:
@@ -317,14 +433,25 @@ class ControllerBridge:
             return
 
         try:
-            # Retry evdev discovery — kernel may need time to create the input device
+            # Retry evdev discovery — kernel may need time to create the input
+            # device. With inotify, rescan as soon as an event node appears.
             evdev_path = None
-            for attempt in range(5):
-                time.sleep(2)
-                evdev_path = self._find_evdev_device(mac, name)
-                if evdev_path:
-                    break
-                print(f"[ControllerBridge] evdev not found for {mac}, retrying ({attempt + 1}/5)...")
+            watch_fd = self._watch_input_dir()
+            try:
+                deadline = time.monotonic() + 10.0
+                while True:
+                    evdev_path = self._find_evdev_device(mac, name)
+                    remaining = deadline - time.monotonic()
+                    if evdev_path or remaining <= 0:
+                        break
+                    print(f"[ControllerBridge] evdev not found for {mac}, waiting for input devices...")
+                    if watch_fd is None:
+                        time.sleep(min(2.0, remaining))
+                    else:
+                        self._wait_for_event_node(watch_fd, deadline)
+            finally:
+                if watch_fd is not None:
+                    os.close(watch_fd)
 
             if evdev_path:
                 led_path = self._find_led_path(evdev_path)
@@ -334,33 +461,62 @@ class ControllerBridge:
                     "led_path": led_path,
                 }
                 self._start_input_reading(mac)
-                self.publish_assignments_status()
+                self._mark_dirty("assignments")
 
                 # Set LED to assignment color (or unassigned)
-                current_slot = None
-                for slot, assigned_mac in self.assignments.items():
-                    if assigned_mac == mac:
-                        current_slot = slot
-                        break
-                self._set_led_for_slot(mac, current_slot)
+                self._set_led_for_slot(mac, self._slot_by_mac.get(mac))
 
                 print(f"[ControllerBridge] Controller ready: {name} ({mac})")
             else:
-                print(f"[ControllerBridge] Could not find evdev device for {mac} after 5 attempts")
+                print(f"[ControllerBridge] Could not find evdev device for {mac} after 10s")
 
         except Exception as e:
             print(f"[ControllerBridge] Error handling connected controller: {e}")
 
+    @staticmethod
+    def _watch_input_dir() -> Optional[int]:
+        """inotify fd watching /dev/input for new/updated nodes, or None if unavailable."""
+        if not INOTIFY_AVAILABLE:
+            return None
+        fd = _inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        if _inotify_add_watch(fd, b"/dev/input", _IN_CREATE | _IN_ATTRIB) < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    @staticmethod
+    def _wait_for_event_node(fd: int, deadline: float):
+        """Block until an eventN node is created/updated in /dev/input, or the deadline."""
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not sel.select(remaining):
+                    return
+                try:
+                    data = os.read(fd, 4096)
+                except BlockingIOError:
+                    continue
+                offset = 0
+                while offset + _INOTIFY_EVENT.size <= len(data):
+                    _, _, _, name_len = _INOTIFY_EVENT.unpack_from(data, offset)
+                    offset += _INOTIFY_EVENT.size
+                    if data[offset:offset + name_len].startswith(b"event"):
+                        return
+                    offset += name_len
+
     def _handle_controller_disconnected(self, mac: str, name: str):
         """Handle a gamepad disconnecting."""
         try:
-            if mac in self.input_threads:
+            if mac in self.input_readers:
                 self._stop_input_reading(mac)
 
             if mac in self.connected_devices:
                 del self.connected_devices[mac]
 
-            self.publish_assignments_status()
+            self._mark_dirty("assignments")
             print(f"[ControllerBridge] Controller disconnected: {name} ({mac})")
 
         except Exception as e:
@@ -371,17 +527,18 @@ class ControllerBridge:
     def _find_evdev_device(self, mac: str, name: str = None) -> Optional[str]:
         """Find evdev device path for a Bluetooth MAC address.
 
-        Three-pass matching:
-        1. MAC in phys field (most reliable)
-        2. Exact device name match
+        Devices are opened and classified in a single pass, then resolved
+        in priority order (only the path is returned; every device opened
+        here is closed again before returning):
+        1. MAC in uniq field (most reliable)
+        2. Exact device name match, then substring
         3. Single unassigned gamepad fallback
         """
         if not EVDEV_AVAILABLE:
             return None
 
+        opened = []
         try:
-            devices = [evdev.InputDevice(path) for path in evdev.list_devices()]
-
             already_assigned = set(
                 info["evdev_path"]
                 for info in self.connected_devices.values()
@@ -389,71 +546,88 @@ class ControllerBridge:
             )
 
             expected_name = (name or "").lower()
+            # Kernel uniq is normally "aa:bb:cc:dd:ee:ff": compare as-is, and
+            # only strip separators for the odd device that formats it differently
+            mac_lower = mac.lower()
+            mac_hex = mac_lower.replace(":", "")
+
+            # Reconnects usually get the same node back: try it before a full scan.
+            # Node numbers are reused, so only trust it if uniq or name still match.
+            cached = self._evdev_by_mac.get(mac)
+            if cached and cached not in already_assigned and os.path.exists(cached):
+                device = evdev.InputDevice(cached)
+                opened.append(device)
+                uniq = (device.uniq or "").lower()
+                if uniq == mac_lower or (expected_name and device.name.lower() == expected_name):
+                    print(f"[ControllerBridge] Found cached evdev: {cached} ({device.name})")
+                    return cached
+
             print(f"[ControllerBridge] Looking for evdev device for {mac} (name: {expected_name})")
-            for d in devices:
-                caps = d.capabilities()
-                has_keys = ecodes.EV_KEY in caps
-                has_abs = ecodes.EV_ABS in caps
-                if has_keys or has_abs:
-                    print(f"[ControllerBridge]   evdev: {d.path} name={d.name!r} phys={d.phys!r}")
 
-            # Pass 1: MAC in uniq field (device's actual BT address)
-            # Require gamepad buttons to avoid matching touchpad/motion event devices
-            mac_normalized = mac.replace(":", "").lower()
-            for device in devices:
-                if device.path in already_assigned:
+            mac_match = None
+            exact_match = None
+            substring_match = None
+            unassigned = []  # Gamepads not bound to another controller
+
+            for path in evdev.list_devices():
+                # Skip before opening: no open() or capabilities ioctl for bound nodes
+                if path in already_assigned:
                     continue
+                device = evdev.InputDevice(path)
+                opened.append(device)
                 caps = device.capabilities()
-                if ecodes.EV_KEY in caps and ecodes.EV_ABS in caps:
-                    keys = caps[ecodes.EV_KEY]
-                    if ecodes.BTN_SOUTH in keys or ecodes.BTN_GAMEPAD in keys:
-                        uniq = device.uniq
-                        if uniq and mac_normalized == uniq.replace(":", "").lower():
-                            print(f"[ControllerBridge] Found by MAC (uniq): {device.path} ({device.name})")
-                            return device.path
-
-            # Pass 2: exact name match, then substring
-            if expected_name:
-                substring_match = None
-                for device in devices:
-                    if device.path in already_assigned:
-                        continue
-                    caps = device.capabilities()
-                    if ecodes.EV_KEY in caps and ecodes.EV_ABS in caps:
-                        dev_name = device.name.lower()
-                        if expected_name == dev_name:
-                            print(f"[ControllerBridge] Found by exact name: {device.path} ({device.name})")
-                            return device.path
-                        if not substring_match and (expected_name in dev_name or dev_name in expected_name):
-                            substring_match = device
-
-                if substring_match:
-                    print(f"[ControllerBridge] Found by substring name: {substring_match.path} ({substring_match.name})")
-                    return substring_match.path
-
-            # Pass 3: single unassigned gamepad fallback
-            unassigned = []
-            for device in devices:
-                if device.path in already_assigned:
+                has_keys = ecodes.EV_KEY in caps
+                has_abs = ecodes.EV_ABS in caps
+                if has_keys or has_abs:
+                    print(f"[ControllerBridge]   evdev: {device.path} name={device.name!r} phys={device.phys!r}")
+                if not (has_keys and has_abs):
                     continue
-                caps = device.capabilities()
-                if ecodes.EV_KEY in caps and ecodes.EV_ABS in caps:
-                    keys = caps[ecodes.EV_KEY]
-                    if ecodes.BTN_SOUTH in keys or ecodes.BTN_GAMEPAD in keys:
-                        unassigned.append(device)
-
-            if len(unassigned) == 1:
-                device = unassigned[0]
-                print(f"[ControllerBridge] Found single unassigned gamepad: {device.path} ({device.name})")
-                return device.path
+
+                # Require gamepad buttons for MAC match to avoid touchpad/motion event devices
+                # One pass over the key list, stopping at the first marker
+                if not _GAMEPAD_BUTTONS.isdisjoint(caps[ecodes.EV_KEY]):
+                    unassigned.append(device)
+                    uniq = device.uniq
+                    if uniq and (uniq.lower() == mac_lower if len(uniq) == 17
+                                 else uniq.replace(":", "").lower() == mac_hex):
+                        mac_match = device
+                        break  # Highest priority, nothing left to compare against
+
+                if expected_name and exact_match is None:
+                    dev_name = device.name.lower()
+                    if expected_name == dev_name:
+                        exact_match = device
+                    elif not substring_match and (expected_name in dev_name or dev_name in expected_name):
+                        substring_match = device
+
+            found = None
+            if mac_match:
+                found = mac_match
+                print(f"[ControllerBridge] Found by MAC (uniq): {found.path} ({found.name})")
+            elif exact_match:
+                found = exact_match
+                print(f"[ControllerBridge] Found by exact name: {found.path} ({found.name})")
+            elif substring_match:
+                found = substring_match
+                print(f"[ControllerBridge] Found by substring name: {found.path} ({found.name})")
+            elif len(unassigned) == 1:
+                found = unassigned[0]
+                print(f"[ControllerBridge] Found single unassigned gamepad: {found.path} ({found.name})")
             elif len(unassigned) > 1:
                 print(f"[ControllerBridge] Multiple unassigned gamepads, cannot determine: "
                       f"{[d.name for d in unassigned]}")
 
+            if found:
+                self._evdev_by_mac[mac] = found.path
+                return found.path
+
             print(f"[ControllerBridge] No evdev device found for {mac}")
 
         except Exception as e:
             print(f"[ControllerBridge] Error finding evdev device: {e}")
+        finally:
+            for device in opened:
+                device.close()
 
         return None
 
@@ -464,30 +638,33 @@ class ControllerBridge:
         if not EVDEV_AVAILABLE:
             return
 
-        if mac in self.input_threads and self.input_threads[mac].is_alive():
+        if mac in self.input_readers:
             return
 
         device_info = self.connected_devices.get(mac)
         if not device_info:
             return
 
-        stop_event = threading.Event()
-        self.input_stop_events[mac] = stop_event
-
-        thread = threading.Thread(
-            target=self._input_reading_worker,
-            args=(mac, device_info["evdev_path"], stop_event),
-            daemon=True,
-        )
-        self.input_threads[mac] = thread
-        thread.start()
+        evdev_path = device_info["evdev_path"]
+        try:
+            device = evdev.InputDevice(evdev_path)
+        except Exception as e:
+            print(f"[ControllerBridge] Input reading error for {mac}: {e}")
+            return
+        print(f"[ControllerBridge] Reading from {device.name} at {evdev_path}")
+
+        reader = _InputReader(mac, device)
+        with self._input_lock:
+            self.input_readers[mac] = reader
+            self._input_selector.register(device.fd, selectors.EVENT_READ, reader)
+            if self._input_thread is None:
+                self._input_thread = threading.Thread(
+                    target=self._input_reading_worker, daemon=True
+                )
+                self._input_thread.start()
 
         # Log assignment state
-        assigned_display = None
-        for disp, assigned_mac in self.assignments.items():
-            if assigned_mac == mac:
-                assigned_display = disp
-                break
+        assigned_display = self._slot_by_mac.get(mac)
         if assigned_display:
             print(f"[ControllerBridge] Input reading started for {mac} -> {assigned_display}")
         else:
@@ -495,42 +672,36 @@ class ControllerBridge:
 
     def _stop_input_reading(self, mac: str):
         """Stop reading input from a gamepad."""
-        if mac in self.input_stop_events:
-            self.input_stop_events[mac].set()
-
-        if mac in self.input_threads:
-            self.input_threads[mac].join(timeout=2)
-            del self.input_threads[mac]
+        with self._input_lock:
+            reader = self.input_readers.pop(mac, None)
+            if reader is None:
+                return
+            try:
+                self._input_selector.unregister(reader.device.fd)
+            except (KeyError, ValueError):
+                pass
 
-        if mac in self.input_stop_events:
-            del self.input_stop_events[mac]
+        try:
+            reader.device.close()
+        except Exception:
+            pass
 
     def _update_pressed_buttons(self, pressed_buttons: set, events) -> bool:
         """Update pressed button set from evdev events. Returns True if any button was pressed."""
         changed = False
         for event in events:
             if event.type == ecodes.EV_KEY:
-                btn_names = ecodes.BTN.get(event.code)
+                btn_names = _BTN_NAMES.get(event.code)
                 if btn_names:
-                    if isinstance(btn_names, str):
-                        btn_names = [btn_names]
-                    for btn_name in btn_names:
-                        if event.value == 1:
-                            pressed_buttons.add(btn_name)
-                            changed = True
-                        elif event.value == 0:
-                            pressed_buttons.discard(btn_name)
+                    if event.value == 1:
+                        pressed_buttons.update(btn_names)
+                        changed = True
+                    elif event.value == 0:
+                        pressed_buttons.difference_update(btn_names)
 
             elif event.type == ecodes.EV_ABS:
-                abs_names = ecodes.ABS.get(event.code)
-                if isinstance(abs_names, tuple):
-                    abs_name = abs_names[0]
-                elif isinstance(abs_names, str):
-                    abs_name = abs_names
-                else:
-                    continue
-
-                if abs_name == "ABS_HAT0X":
+                code = event.code
+                if code == ecodes.ABS_HAT0X:
                     pressed_buttons.discard("DPAD_LEFT")
                     pressed_buttons.discard("DPAD_RIGHT")
                     if event.value == -1:
@@ -539,7 +710,7 @@ class ControllerBridge:
                     elif event.value == 1:
                         pressed_buttons.add("DPAD_RIGHT")
                         changed = True
-                elif abs_name == "ABS_HAT0Y":
+                elif code == ecodes.ABS_HAT0Y:
                     pressed_buttons.discard("DPAD_UP")
                     pressed_buttons.discard("DPAD_DOWN")
                     if event.value == -1:
@@ -548,14 +719,14 @@ class ControllerBridge:
                     elif event.value == 1:
                         pressed_buttons.add("DPAD_DOWN")
                         changed = True
-                elif abs_name == "ABS_Z":
+                elif code == ecodes.ABS_Z:
                     if event.value > 128:
                         if "ABS_Z" not in pressed_buttons:
                             pressed_buttons.add("ABS_Z")
                             changed = True
                     else:
                         pressed_buttons.discard("ABS_Z")
-                elif abs_name == "ABS_RZ":
+                elif code == ecodes.ABS_RZ:
                     if event.value > 128:
                         if "ABS_RZ" not in pressed_buttons:
                             pressed_buttons.add("ABS_RZ")
@@ -564,175 +735,194 @@ class ControllerBridge:
                         pressed_buttons.discard("ABS_RZ")
         return changed
 
-    def _input_reading_worker(self, mac: str, evdev_path: str, stop_event: threading.Event):
-        """Worker thread for reading gamepad input."""
-        try:
-            device = evdev.InputDevice(evdev_path)
-            print(f"[ControllerBridge] Reading from {device.name} at {evdev_path}")
-
-            dpad_x_state = 0
-            dpad_y_state = 0
-            was_assigned = False
-            pressed_buttons = set()  # Raw button names for combo detection
-            first_read = True  # Discard first batch of buffered events
+    def _input_reading_worker(self):
+        """Worker thread reading every registered gamepad.
 
-            while not stop_event.is_set():
-                r, _, _ = select.select([device.fd], [], [], 0.01)
-                if not r:
+        Blocks in the selector (no timeout) until any pad has input, or
+        cleanup() signals the wakeup eventfd.
+        """
+        EV_KEY, EV_ABS, EV_SYN, SYN_REPORT = (
+            ecodes.EV_KEY, ecodes.EV_ABS, ecodes.EV_SYN, ecodes.SYN_REPORT)
+        while self.running:
+            try:
+                ready = self._input_selector.select()
+            except (OSError, ValueError):
+                break  # Selector closed during cleanup
+
+            for key, _ in ready:
+                reader = key.data
+                if reader is None:
+                    continue  # Wakeup: self.running is re-checked by the loop
+                # Skip readers stopped or restarted since select() returned
+                if self.input_readers.get(reader.mac) is not reader:
                     continue
 
                 try:
-                    events = list(device.read())
-                except (BlockingIOError, OSError):
+                    if reader.first_read:
+                        # Discard initial buffered events from before we started reading
+                        deque(reader.device.read(), maxlen=0)
+                        reader.first_read = False
+                        reader.pressed_buttons.clear()
+                        continue
+                    # Keep only events the handlers use: keys, hat/trigger axes, frame ends
+                    events = [
+                        e for e in reader.device.read()
+                        if e.type == EV_KEY
+                        or (e.type == EV_ABS and e.code in _HANDLED_ABS)
+                        or (e.type == EV_SYN and e.code == SYN_REPORT)
+                    ]
+                except BlockingIOError:
+                    continue
+                except OSError as e:
+                    print(f"[ControllerBridge] Input device lost for {reader.mac}: {e}")
+                    if self.input_readers.get(reader.mac) is reader:
+                        self._stop_input_reading(reader.mac)
                     continue
 
                 if not events:
                     continue
 
-                # Discard initial buffered events from before we started reading
-                if first_read:
-                    first_read = False
-                    pressed_buttons.clear()
-                    continue
+                try:
+                    self._handle_input_events(reader, events)
+                except Exception as e:
+                    print(f"[ControllerBridge] Input reading error for {reader.mac}: {e}")
+
+    def _handle_input_events(self, reader: _InputReader, events: list):
+        """Handle one batch of evdev events read from a gamepad."""
+        mac = reader.mac
+
+        # Always track pressed buttons (for assignment combos)
+        combo_changed = self._update_pressed_buttons(reader.pressed_buttons, events)
+
+        # Check assignment combos (works regardless of current slot)
+        if combo_changed and self.assignment_combos:
+            # Sort by length descending: PS+L1+R1 (3) before PS+L1 (2)
+            for slot, combo_set in sorted(
+                self.assignment_combos.items(),
+                key=lambda x: len(x[1]),
+                reverse=True
+            ):
+                if combo_set.issubset(reader.pressed_buttons):
+                    # Don't re-assign if already on this slot
+                    if self._slot_by_mac.get(mac) != slot:
+                        print(f"[ControllerBridge] Assignment combo: {mac} -> {slot}")
+                        self.assign_display(mac, slot)
+                    break
 
-                # Always track pressed buttons (for assignment combos)
-                combo_changed = self._update_pressed_buttons(pressed_buttons, events)
+        # Find current assignment
+        assigned_slot = self._slot_by_mac.get(mac)
 
-                # Check assignment combos (works regardless of current slot)
-                if combo_changed and self.assignment_combos:
-                    # Sort by length descending: PS+L1+R1 (3) before PS+L1 (2)
-                    for slot, combo_set in sorted(
-                        self.assignment_combos.items(),
-                        key=lambda x: len(x[1]),
+        if not assigned_slot:
+            reader.was_assigned = False
+            return
+
+        # Discard buffered events on first assignment
+        if not reader.was_assigned:
+            print(f"[ControllerBridge] {mac} assigned to {assigned_slot}, discarding buffered events")
+            reader.was_assigned = True
+            return
+
+        # Presets controller: preset combo + action combo detection, no input forwarding
+        if assigned_slot == "presets":
+            if combo_changed and self.preset_combos:
+                now = time.time()
+                cooldown = self.combo_cooldown.get(mac, 0)
+                if now - cooldown >= 1.0:
+                    # Sort by length descending so L1+DPAD_UP matches before DPAD_UP alone
+                    for combo_set, preset_name in sorted(
+                        self.preset_combos.items(),
+                        key=lambda x: len(x[0]),
                         reverse=True
                     ):
-                        if combo_set.issubset(pressed_buttons):
-                            # Don't re-assign if already on this slot
-                            current_slot = None
-                            for s, m in self.assignments.items():
-                                if m == mac:
-                                    current_slot = s
-                                    break
-                            if current_slot != slot:
-                                print(f"[ControllerBridge] Assignment combo: {mac} -> {slot}")
-                                self.assign_display(mac, slot)
+                        if combo_set.issubset(reader.pressed_buttons):
+                            print(f"[ControllerBridge] Combo matched: {preset_name}")
+                            self.combo_cooldown[mac] = now
+                            self.mqtt_client.publish(
+                                "protogen/fins/launcher/preset/activate",
+                                _dumps({"name": preset_name}),
+                                qos=0
+                            )
                             break
-
-                # Find current assignment
-                assigned_slot = None
-                for slot, assigned_mac in self.assignments.items():
-                    if assigned_mac == mac:
-                        assigned_slot = slot
+            # Check system action combos
+            if combo_changed and self.action_combos:
+                for action_id, buttons in sorted(
+                    self.action_combos.items(),
+                    key=lambda x: len(x[1]),
+                    reverse=True
+                ):
+                    if buttons.issubset(reader.pressed_buttons):
+                        print(f"[ControllerBridge] Action combo matched: {action_id}")
+                        self._execute_action(action_id)
                         break
+            return
 
-                if not assigned_slot:
-                    was_assigned = False
-                    continue
-
-                # Discard buffered events on first assignment
-                if not was_assigned:
-                    print(f"[ControllerBridge] {mac} assigned to {assigned_slot}, discarding buffered events")
-                    was_assigned = True
-                    continue
-
-                # Presets controller: preset combo + action combo detection, no input forwarding
-                if assigned_slot == "presets":
-                    if combo_changed and self.preset_combos:
-                        now = time.time()
-                        cooldown = self.combo_cooldown.get(mac, 0)
-                        if now - cooldown >= 1.0:
-                            # Sort by length descending so L1+DPAD_UP matches before DPAD_UP alone
-                            for combo_set, preset_name in sorted(
-                                self.preset_combos.items(),
-                                key=lambda x: len(x[0]),
-                                reverse=True
-                            ):
-                                if combo_set.issubset(pressed_buttons):
-                                    print(f"[ControllerBridge] Combo matched: {preset_name}")
-                                    self.combo_cooldown[mac] = now
-                                    self.mqtt_client.publish(
-                                        "protogen/fins/launcher/preset/activate",
-                                        json.dumps({"name": preset_name}),
-                                        qos=0
-                                    )
-                                    break
-                    # Check system action combos
-                    if combo_changed and self.action_combos:
-                        for action_id, buttons in sorted(
-                            self.action_combos.items(),
-                            key=lambda x: len(x[1]),
-                            reverse=True
-                        ):
-                            if buttons.issubset(pressed_buttons):
-                                print(f"[ControllerBridge] Action combo matched: {action_id}")
-                                self._execute_action(action_id)
-                                break
-                    continue
-
-                # Left/right display: forward input to launcher
-                display = assigned_slot
-                for event in events:
-                    if event.type == ecodes.EV_KEY:
-                        button_names = ecodes.BTN.get(event.code)
-                        if button_names:
-                            if isinstance(button_names, str):
-                                names_to_check = [button_names]
-                            else:
-                                names_to_check = button_names
-
-                            mapped_key = None
-                            for name in names_to_check:
-                                if name in self.button_mapping:
-                                    mapped_key = self.button_mapping[name]
-                                    break
-
-                            if mapped_key:
-                                action = "keydown" if event.value == 1 else "keyup"
-                                self._send_input(mapped_key, action, display)
-
-                    elif event.type == ecodes.EV_ABS:
-                        abs_names = ecodes.ABS.get(event.code)
-                        if isinstance(abs_names, str):
-                            abs_name = abs_names
-                        elif isinstance(abs_names, tuple):
-                            abs_name = abs_names[0]
-                        else:
-                            abs_name = None
-
-                        if abs_name == "ABS_HAT0X":
-                            old = dpad_x_state
-                            dpad_x_state = event.value
-                            if old == -1:
-                                self._send_input("Left", "keyup", display)
-                            elif old == 1:
-                                self._send_input("Right", "keyup", display)
-                            if dpad_x_state == -1:
-                                self._send_input("Left", "keydown", display)
-                            elif dpad_x_state == 1:
-                                self._send_input("Right", "keydown", display)
-
-                        elif abs_name == "ABS_HAT0Y":
-                            old = dpad_y_state
-                            dpad_y_state = event.value
-                            if old == -1:
-                                self._send_input("Up", "keyup", display)
-                            elif old == 1:
-                                self._send_input("Down", "keyup", display)
-                            if dpad_y_state == -1:
-                                self._send_input("Up", "keydown", display)
-                            elif dpad_y_state == 1:
-                                self._send_input("Down", "keydown", display)
-
-        except Exception as e:
-            print(f"[ControllerBridge] Input reading error for {mac}: {e}")
+        # Left/right display: forward input to launcher. Hat values are
+        # coalesced per SYN_REPORT frame, only the last one in a frame counts.
+        display = assigned_slot
+        key_by_code = self._key_by_code
+        frame: Dict[int, int] = {}
+        pending: list = []  # Inputs from this read, published together
+        for event in events:
+            if event.type == ecodes.EV_KEY:
+                mapped_key = key_by_code.get(event.code)
+                if mapped_key:
+                    action = "keydown" if event.value == 1 else "keyup"
+                    self._queue_input(pending, mapped_key, action, display)
 
-    def _send_input(self, key: str, action: str, display: str):
-        """Send input to launcher via MQTT (QoS 0 for low latency)."""
-        message = {"key": key, "action": action, "display": display}
-        self.mqtt_client.publish("protogen/fins/launcher/input/exec", json.dumps(message), qos=0)
+            elif event.type == ecodes.EV_ABS:
+                if event.code in (ecodes.ABS_HAT0X, ecodes.ABS_HAT0Y):
+                    frame[event.code] = event.value
+
+            elif event.type == ecodes.EV_SYN and event.code == ecodes.SYN_REPORT:
+                if frame:
+                    self._flush_dpad_frame(reader, frame, display, pending)
+                    frame.clear()
+
+        if frame:
+            self._flush_dpad_frame(reader, frame, display, pending)
+        self._send_inputs(pending)
+
+    def _flush_dpad_frame(self, reader: _InputReader, frame: Dict[int, int], display: str,
+                          pending: list):
+        """Send dpad key transitions for the last hat values of one evdev frame."""
+        for code, attr, neg_key, pos_key in (
+            (ecodes.ABS_HAT0X, "dpad_x_state", "Left", "Right"),
+            (ecodes.ABS_HAT0Y, "dpad_y_state", "Up", "Down"),
+        ):
+            if code not in frame:
+                continue
+            old = getattr(reader, attr)
+            new = frame[code]
+            if new == old:
+                continue
+            setattr(reader, attr, new)
+            if old == -1:
+                self._queue_input(pending, neg_key, "keyup", display)
+            elif old == 1:
+                self._queue_input(pending, pos_key, "keyup", display)
+            if new == -1:
+                self._queue_input(pending, neg_key, "keydown", display)
+            elif new == 1:
+                self._queue_input(pending, pos_key, "keydown", display)
+
+    @staticmethod
+    def _queue_input(pending: list, key: str, action: str, display: str):
+        """Queue one input for _send_inputs()."""
+        pending.append({"key": key, "action": action, "display": display})
         if action == "keydown":
             print(f"[ControllerBridge] {key} -> {display}")
 
+    def _send_inputs(self, pending: list):
+        """Send queued inputs to launcher via MQTT (QoS 0 for low latency), one message per read."""
+        if not pending:
+            return
+        if len(pending) == 1:
+            self.mqtt_client.publish("protogen/fins/launcher/input/exec",
+                                     _dumps(pending[0]), qos=0)
+        else:
+            self.mqtt_client.publish("protogen/fins/launcher/input/exec_batch",
+                                     _dumps({"events": pending}), qos=0)
+
     # ======== Assignments ========
 
     def _handle_assign(self, payload: str):
@@ -749,27 +939,31 @@ class ControllerBridge:
     def assign_display(self, mac: Optional[str], display: str):
         """Assign a controller to a display (or remove if mac is None)."""
         if mac is None:
-            old_mac = self.assignments.get(display)
-            self.assignments[display] = None
+            with self._assign_lock:
+                old_mac = self.assignments.get(display)
+                self.assignments[display] = None
+                self._reindex_assignments()
             print(f"[ControllerBridge] Removed assignment for {display}")
 
             if old_mac and old_mac in self.connected_devices:
                 self._set_led_for_slot(old_mac, None)
                 self._restart_input_thread_if_safe(old_mac)
 
-            self.publish_assignments_status()
+            self._mark_dirty("assignments")
             return
 
         if mac not in self.connected_devices:
             print(f"[ControllerBridge] Cannot assign {mac}: not connected")
             return
 
-        # Clear old assignment for this MAC
-        for d, m in list(self.assignments.items()):
-            if m == mac and d != display:
-                self.assignments[d] = None
+        with self._assign_lock:
+            # Clear old assignment for this MAC
+            for d, m in self.assignments.items():
+                if m == mac and d != display:
+                    self.assignments[d] = None
 
-        self.assignments[display] = mac
+            self.assignments[display] = mac
+            self._reindex_assignments()
         name = self.connected_devices[mac].get("name", mac)
         print(f"[ControllerBridge] Assigned {mac} to {display}")
         publish_notification(self.mqtt_client, "controller", "assigned",
@@ -781,13 +975,13 @@ class ControllerBridge:
         # Restart input thread (skip if called from within the input thread itself)
         self._restart_input_thread_if_safe(mac)
 
-        self.publish_assignments_status()
+        self._mark_dirty("assignments")
 
     def _restart_input_thread_if_safe(self, mac: str):
-        """Restart input thread unless we're being called from that thread (avoids deadlock)."""
-        if mac in self.input_threads:
-            if self.input_threads[mac] is threading.current_thread():
-                # Called from combo within the input worker — thread picks up new slot naturally
+        """Restart input reading unless we're being called from the input thread."""
+        if mac in self.input_readers:
+            if self._input_thread is threading.current_thread():
+                # Called from combo within the input worker — reader picks up new slot naturally
                 return
             self._stop_input_reading(mac)
             self._start_input_reading(mac)
@@ -798,14 +992,23 @@ class ControllerBridge:
             if not payload:
                 return
             data = json.loads(payload)
-            for slot in ["left", "right", "presets"]:
-                if slot in data and data[slot]:
-                    mac = data[slot].get("mac")
-                    if mac:
-                        self.assignments[slot] = mac
-                        print(f"[ControllerBridge] Restored assignment: {mac} -> {slot}")
+            with self._assign_lock:
+                for slot in ["left", "right", "presets"]:
+                    if slot in data and data[slot]:
+                        mac = data[slot].get("mac")
+                        if mac:
+                            self.assignments[slot] = mac
+                            print(f"[ControllerBridge] Restored assignment: {mac} -> {slot}")
+                self._reindex_assignments()
         except Exception as e:
             print(f"[ControllerBridge] Error restoring assignments: {e}")
+        finally:
+            # Only release init_mqtt() once the assignments are in place
+            self._retained_event.set()
+
+    def _reindex_assignments(self):
+        """Rebuild the {mac: slot} index from self.assignments (first slot wins; hold _assign_lock)."""
+        self._slot_by_mac = {m: d for d, m in reversed(self.assignments.items()) if m}
 
     def _update_preset_combos(self, payload: str):
         """Update preset combo lookup from launcher presets status."""
@@ -867,11 +1070,7 @@ class ControllerBridge:
         config = {}
         for slot, combo_set in self.assignment_combos.items():
             config[slot] = sorted(combo_set)
-        self.mqtt_client.publish(
-            "protogen/fins/controllerbridge/status/combo_config",
-            json.dumps(config),
-            retain=True,
-        )
+        self._publish_retained("protogen/fins/controllerbridge/status/combo_config", config)
 
     # ======== Assignment Color Config ========
 
@@ -897,9 +1096,8 @@ class ControllerBridge:
 
             # For "unassigned", apply to all unassigned controllers
             if slot == "unassigned":
-                assigned_macs = set(m for m in self.assignments.values() if m)
-                for mac in self.connected_devices:
-                    if mac not in assigned_macs:
+                for mac in list(self.connected_devices):  # Written by the device worker
+                    if mac not in self._slot_by_mac:
                         self._set_led_color(mac, *rgb)
 
             self.publish_color_config()
@@ -929,11 +1127,7 @@ class ControllerBridge:
         config = {}
         for slot, rgb in self.assignment_colors.items():
             config[slot] = list(rgb)
-        self.mqtt_client.publish(
-            "protogen/fins/controllerbridge/status/color_config",
-            json.dumps(config),
-            retain=True,
-        )
+        self._publish_retained("protogen/fins/controllerbridge/status/color_config", config)
 
     # ======== System Action Combos ========
 
@@ -985,7 +1179,7 @@ class ControllerBridge:
             new_vol = max(0, min(100, self._current_volume + step))
             self.mqtt_client.publish(
                 "protogen/fins/audiobridge/volume/set",
-                json.dumps({"volume": new_vol}),
+                _dumps({"volume": new_vol}),
             )
             print(f"[ControllerBridge] Volume {'+' if step > 0 else ''}{step}% -> {new_vol}%")
             return
@@ -1020,7 +1214,7 @@ class ControllerBridge:
             # Toggle action — invert current state
             current = self.service_states.get(toggle_key, False)
             new_state = not current
-            payload = json.dumps({"enable": new_state})
+            payload = _dumps({"enable": new_state})
             self.mqtt_client.publish(topic, payload)
             state_word = "enabled" if new_state else "disabled"
             print(f"[ControllerBridge] Action: {action} -> {state_word}")
@@ -1078,14 +1272,43 @@ class ControllerBridge:
         config = {}
         for action_id, buttons in self.action_combos.items():
             config[action_id] = sorted(buttons)
-        self.mqtt_client.publish(
-            "protogen/fins/controllerbridge/status/action_combo_config",
-            json.dumps(config),
-            retain=True,
-        )
+        self._publish_retained("protogen/fins/controllerbridge/status/action_combo_config", config)
 
     # ======== Status Publishing ========
 
+    def _publish_retained(self, topic: str, data):
+        """Publish a retained status payload, skipping it if identical to the last one sent."""
+        payload = _dumps(data)
+        digest = hashlib.blake2b(payload, digest_size=8).digest()
+        if self._last_status_hash.get(topic) == digest:
+            return
+        self.mqtt_client.publish(topic, payload, retain=True)
+        self._last_status_hash[topic] = digest
+
+    def _mark_dirty(self, kind: str):
+        """
+        Schedule a status publish (currently only "assignments").
+
+        Connect/disconnect bursts and combo reassignments mark status dirty
+        many times; it is published once at most 100ms later.
+        """
+        with self._publish_lock:
+            self._status_dirty.add(kind)
+            if self._publish_timer is None:
+                self._publish_timer = threading.Timer(0.1, self._flush_publishes)
+                self._publish_timer.daemon = True
+                self._publish_timer.start()
+
+    def _flush_publishes(self):
+        """Publish the status marked dirty since the last flush."""
+        with self._publish_lock:
+            dirty = self._status_dirty
+            self._status_dirty = set()
+            self._publish_timer = None
+
+        if "assignments" in dirty:
+            self.publish_assignments_status()
+
     def publish_assignments_status(self):
         """Publish controller assignments."""
         if not self.mqtt_client:
@@ -1103,11 +1326,7 @@ class ControllerBridge:
             else:
                 assignments[display] = None
 
-        self.mqtt_client.publish(
-            "protogen/fins/controllerbridge/status/assignments",
-            json.dumps(assignments),
-            retain=True,
-        )
+        self._publish_retained("protogen/fins/controllerbridge/status/assignments", assignments)
 
     # ======== Lifecycle ========
 
@@ -1115,9 +1334,18 @@ class ControllerBridge:
         """Clean up resources."""
         print("[ControllerBridge] Cleaning up...")
 
-        # Stop all input threads
-        for mac in list(self.input_threads.keys()):
+        # Stop the device worker once already queued tasks have run
+        self._device_queue.put((None, ()))
+
+        # Stop all input reading
+        self.running = False
+        for mac in list(self.input_readers.keys()):
             self._stop_input_reading(mac)
+        os.eventfd_write(self._input_wakeup, 1)
+        if self._input_thread:
+            self._input_thread.join(timeout=2)
+        self._input_selector.close()
+        os.close(self._input_wakeup)
 
         if self.mqtt_client:
             self.mqtt_client.loop_stop()
@@ -1130,6 +1358,9 @@ class ControllerBridge:
         if not EVDEV_AVAILABLE:
             print("[ControllerBridge] WARNING: evdev not available, input reading disabled")
 
+        self._device_thread = threading.Thread(target=self._device_worker, daemon=True)
+        self._device_thread.start()
+
         self.init_mqtt()
         print("[ControllerBridge] Running. Press Ctrl+C to stop.")
 
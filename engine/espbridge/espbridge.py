@@ -69,8 +69,9 @@ class ESPBridge:
         0xDE,0xD9,0xD0,0xD7,0xC2,0xC5,0xCC,0xCB,0xE6,0xE1,0xE8,0xEF,0xFA,0xFD,0xF4,0xF3,
     )
 
-    # Topics ESP32 actually handles - only forward these
-    ESP32_TOPICS = [
+    # Topic prefixes ESP32 actually handles - only forward these. A tuple so
+    # str.startswith() tests them all in one call.
+    ESP32_TOPICS = (
         "protogen/visor/esp/set/fan",
         "protogen/visor/esp/set/fanmode",
         "protogen/visor/esp/config/fancurve",
@@ -88,7 +89,7 @@ class ESPBridge:
         "protogen/visor/teensy/menu/get",
         "protogen/visor/teensy/menu/save",
         "protogen/visor/esp/restart",
-    ]
+    )
 
     def __init__(self, serial_port: str = "/dev/ttyUSB0", baud_rate: int = 921600):
         self.serial_port = serial_port
@@ -242,16 +243,17 @@ class ESPBridge:
         """Handle incoming MQTT message"""
         try:
             topic = msg.topic
-            payload = msg.payload.decode("utf-8", errors="replace")
 
             # Don't forward messages that originated from ESP32
             if topic.startswith("protogen/visor/esp/status/") or topic == "protogen/visor/teensy/raw":
                 return
 
             # Only forward topics ESP32 actually handles
-            if not any(topic.startswith(t) for t in self.ESP32_TOPICS):
+            if not topic.startswith(self.ESP32_TOPICS):
                 return
 
+            payload = msg.payload.decode("utf-8", errors="replace")
+
             # Strip large payloads for ESP32's 512-byte serial buffer
             if topic == "protogen/fins/renderer/status/shader":
                 try:
@@ -9,6 +9,7 @@ import json
 import os
 import glob
 import threading
+import traceback
 from typing import Optional, List, Dict
 import sys
 
@@ -33,6 +34,7 @@ class Launcher:
         - protogen/fins/launcher/kill/{audio,video,exec}
         - protogen/fins/launcher/config/reload
         - protogen/fins/launcher/input/exec
+        - protogen/fins/launcher/input/exec_batch
         - protogen/fins/launcher/preset/{save,delete,activate,set_default}
         - protogen/fins/launcher/status/presets  (retained restore)
 
@@ -93,6 +95,7 @@ class Launcher:
                 client.subscribe("protogen/fins/launcher/config/reload")
                 client.subscribe("protogen/fins/config/reload")
                 client.subscribe("protogen/fins/launcher/input/exec")
+                client.subscribe("protogen/fins/launcher/input/exec_batch")
 
                 # Preset topics
                 client.subscribe("protogen/fins/launcher/preset/save")
@@ -158,6 +161,9 @@ class Launcher:
             elif topic == "protogen/fins/launcher/input/exec":
                 if self.exec_launcher:
                     self.exec_launcher.handle_input_message(payload)
+            elif topic == "protogen/fins/launcher/input/exec_batch":
+                if self.exec_launcher:
+                    self.exec_launcher.handle_input_batch(payload)
 
             # Preset commands
             elif topic == "protogen/fins/launcher/preset/save":
@@ -173,8 +179,6 @@ class Launcher:
 
         except Exception as e:
             print(f"[Launcher] Error handling message on {topic}: {e}")
-            import traceback
-
             traceback.print_exc()
 
     def handle_start_audio(self, payload: str):
@@ -210,8 +214,6 @@ class Launcher:
 
         except Exception as e:
             print(f"[Launcher] Error starting audio: {e}")
-            import traceback
-
             traceback.print_exc()
 
     def handle_start_video(self, payload: str):
@@ -257,8 +259,6 @@ class Launcher:
 
         except Exception as e:
             print(f"[Launcher] Error starting video: {e}")
-            import traceback
-
             traceback.print_exc()
 
     def handle_start_exec(self, payload: str):
@@ -312,8 +312,6 @@ class Launcher:
 
         except Exception as e:
             print(f"[Launcher] Error starting exec: {e}")
-            import traceback
-
             traceback.print_exc()
 
     def handle_stop_audio(self, payload: str):
@@ -678,7 +676,6 @@ class Launcher:
 
         except Exception as e:
             print(f"[Launcher] Error activating preset: {e}")
-            import traceback
             traceback.print_exc()
 
     def _apply_launcher_action(self, action):
@@ -698,7 +695,6 @@ class Launcher:
                     self.handle_start_audio(action_file)
         except Exception as e:
             print(f"[Launcher] Error applying launcher action: {e}")
-            import traceback
             traceback.print_exc()
 
     def handle_preset_set_default(self, payload: str):
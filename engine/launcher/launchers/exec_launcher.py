@@ -4,9 +4,10 @@ Generic Executable Launcher - Runs .sh scripts
 
 import subprocess
 import time
+import traceback
 import os
 import json
-import select
+import selectors
 from typing import Callable, Optional, Dict
 from launcher.launchers.base_launcher import BaseLauncher
 from utils.program_helper import ProgramHelper
@@ -123,8 +124,6 @@ class ExecLauncher(BaseLauncher):
 
         except Exception as e:
             print(f"[ExecLauncher] Failed to launch script: {e}")
-            import traceback
-
             traceback.print_exc()
             return False
 
@@ -203,29 +202,61 @@ class ExecLauncher(BaseLauncher):
             time.sleep(1.0)
             return
 
-        # Read messages from mosquitto_sub with timeout
+        # Read messages from mosquitto_sub with timeout. The pipe is
+        # non-blocking and split into lines here, so a partial line can't
+        # stall a readline() past the deadline.
         timeout_total = 30.0
-        start_time = time.time()
-
-        while time.time() - start_time < timeout_total:
-            # Check if there's data to read (non-blocking)
-            ready, _, _ = select.select([self._setup_listener.stdout], [], [], 0.5)
-            if ready:
-                line = self._setup_listener.stdout.readline().decode().strip().lower()
-                if line == "started":
-                    print(f"[ExecLauncher] Script signaled setup started")
-                    self._setup_started = True
-                elif line == "ready":
-                    print(f"[ExecLauncher] Script signaled ready")
+        start_time = time.monotonic()
+        deadline = start_time + timeout_total
+
+        fd = self._setup_listener.stdout.fileno()
+        os.set_blocking(fd, False)
+        sel = selectors.DefaultSelector()
+        sel.register(fd, selectors.EVENT_READ)
+        buffer = b""
+
+        try:
+            while True:
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+
+                # If we haven't seen "started" after 1 second, script doesn't use signaling
+                if not self._setup_started:
+                    if now - start_time > 1.0:
+                        print(f"[ExecLauncher] No setup signal received, using default wait")
+                        self._stop_setup_listener()
+                        time.sleep(0.5)
+                        return
+                    timeout = start_time + 1.0 - now + 0.01
+                else:
+                    timeout = deadline - now
+
+                if not sel.select(timeout):
+                    continue
+
+                try:
+                    chunk = os.read(fd, 4096)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    # mosquitto_sub exited without a "ready" message
+                    print(f"[ExecLauncher] Setup listener exited, proceeding")
                     self._stop_setup_listener()
                     return
 
-            # If we haven't seen "started" after 1 second, script doesn't use signaling
-            if not self._setup_started and time.time() - start_time > 1.0:
-                print(f"[ExecLauncher] No setup signal received, using default wait")
-                self._stop_setup_listener()
-                time.sleep(0.5)
-                return
+                *lines, buffer = (buffer + chunk).split(b"\n")
+                for raw in lines:
+                    line = raw.decode(errors="replace").strip().lower()
+                    if line == "started":
+                        print(f"[ExecLauncher] Script signaled setup started")
+                        self._setup_started = True
+                    elif line == "ready":
+                        print(f"[ExecLauncher] Script signaled ready")
+                        self._stop_setup_listener()
+                        return
+        finally:
+            sel.close()
 
         print(f"[ExecLauncher] Timeout waiting for ready signal, proceeding anyway")
         self._stop_setup_listener()
@@ -312,7 +343,6 @@ class ExecLauncher(BaseLauncher):
 
         except Exception as e:
             print(f"[ExecLauncher] Error discovering windows: {e}")
-            import traceback
             traceback.print_exc()
 
     def subscribe_to_inputs(self):
@@ -335,50 +365,68 @@ class ExecLauncher(BaseLauncher):
             payload: JSON string with format {"key": "SPACE", "action": "key", "display": "left"}
         """
         try:
-            # Parse JSON payload
-            data = json.loads(payload)
-            key = data.get("key", "")
-            action = data.get("action", "key")
-            display = data.get("display", "left")
-
-            if not key:
-                print("[ExecLauncher] Invalid input: missing 'key' field")
-                return
+            self._route_input(json.loads(payload))
 
-            # Determine which window(s) to send input to
-            target_windows = []
-            if display == "both":
-                # Send to all discovered windows
-                target_windows = list(set(self.windows.values()))
-            elif display in ["left", "right"]:
-                window_id = self.windows.get(display)
-                if window_id:
-                    target_windows = [window_id]
-            else:
-                print(f"[ExecLauncher] Invalid display: {display}")
-                return
+        except json.JSONDecodeError as e:
+            print(f"[ExecLauncher] Invalid JSON in input message: {e}")
+        except Exception as e:
+            print(f"[ExecLauncher] Error handling input message: {e}")
+            traceback.print_exc()
 
-            if not target_windows:
-                print(f"[ExecLauncher] No window found for display '{display}'")
-                return
+    def handle_input_batch(self, payload: str):
+        """
+        Handle a batch of MQTT input events, routed in order
 
-            # Send input to target window(s)
-            for window_id in target_windows:
-                success = ProgramHelper.send_input(
-                    window_id,
-                    key,
-                    action,
-                    use_window_target=self.use_window_targeting
-                )
-                if success:
-                    target_desc = f"window {window_id}" if self.use_window_targeting else "focused window"
-                    print(f"[ExecLauncher] Sent {action}({key}) to {display} {target_desc}")
-                else:
-                    print(f"[ExecLauncher] Failed to send {action}({key}) to window {window_id}")
+        Args:
+            payload: JSON string with format {"events": [{"key": ..., "action": ..., "display": ...}, ...]}
+        """
+        try:
+            for data in json.loads(payload).get("events", []):
+                self._route_input(data)
 
         except json.JSONDecodeError as e:
-            print(f"[ExecLauncher] Invalid JSON in input message: {e}")
+            print(f"[ExecLauncher] Invalid JSON in input batch: {e}")
         except Exception as e:
-            print(f"[ExecLauncher] Error handling input message: {e}")
-            import traceback
+            print(f"[ExecLauncher] Error handling input batch: {e}")
             traceback.print_exc()
+
+    def _route_input(self, data: dict):
+        """Send one parsed input event to the window(s) of its display"""
+        key = data.get("key", "")
+        action = data.get("action", "key")
+        display = data.get("display", "left")
+
+        if not key:
+            print("[ExecLauncher] Invalid input: missing 'key' field")
+            return
+
+        # Determine which window(s) to send input to
+        target_windows = []
+        if display == "both":
+            # Send to all discovered windows
+            target_windows = list(set(self.windows.values()))
+        elif display in ["left", "right"]:
+            window_id = self.windows.get(display)
+            if window_id:
+                target_windows = [window_id]
+        else:
+            print(f"[ExecLauncher] Invalid display: {display}")
+            return
+
+        if not target_windows:
+            print(f"[ExecLauncher] No window found for display '{display}'")
+            return
+
+        # Send input to target window(s)
+        for window_id in target_windows:
+            success = ProgramHelper.send_input(
+                window_id,
+                key,
+                action,
+                use_window_target=self.use_window_targeting
+            )
+            if success:
+                target_desc = f"window {window_id}" if self.use_window_targeting else "focused window"
+                print(f"[ExecLauncher] Sent {action}({key}) to {display} {target_desc}")
+            else:
+                print(f"[ExecLauncher] Failed to send {action}({key}) to window {window_id}")
@@ -4,7 +4,6 @@ Uses IEEE OUI database stored persistently for offline operation
 """
 
 import os
-import re
 import urllib.request
 from typing import Dict, Optional
 from pathlib import Path
@@ -49,15 +48,15 @@ class OUILookup:
             with open(self.oui_file, 'r', encoding='utf-8', errors='ignore') as f:
                 # Parse oui.txt format:
                 # XX-XX-XX   (hex)    Vendor Name
-                # Example: 00-00-00   (hex)		XEROX CORPORATION
-                pattern = re.compile(r'^([0-9A-F]{2}-[0-9A-F]{2}-[0-9A-F]{2})\s+\(hex\)\s+(.+)$')
-                
+                # Fixed shape, so split on whitespace instead of running a regex per line
                 for line in f:
-                    match = pattern.match(line.strip())
-                    if match:
-                        prefix = match.group(1)
-                        vendor = match.group(2).strip()
-                        self.oui_db[prefix] = vendor
+                    parts = line.split(None, 2)
+                    if len(parts) != 3 or parts[1] != "(hex)":
+                        continue
+                    prefix = parts[0]
+                    if len(prefix) != 8 or prefix[2] != "-" or prefix[5] != "-":
+                        continue
+                    self.oui_db[prefix.upper()] = parts[2].strip()
             
             print(f"[OUILookup] Loaded {len(self.oui_db)} vendor entries")
         except Exception as e:
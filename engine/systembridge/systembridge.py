@@ -6,6 +6,7 @@ Exposes RPi 5 system health data and hardware controls via MQTT.
 import glob
 import json
 import os
+import re
 import signal
 import subprocess
 import sys
@@ -22,6 +23,12 @@ from config.loader import ConfigLoader
 from utils.mqtt_client import create_mqtt_client
 from utils.notifications import publish_notification
 
+# "  trip_N: <value>" lines in config.yaml, rewritten by _save_fan_curve_to_config
+_FAN_TRIP_RES = {
+    key: re.compile(rf"^(\s*{key}:\s*)[\d.]+", re.MULTILINE)
+    for key in ("trip_1", "trip_2", "trip_3", "trip_4")
+}
+
 
 class SystemBridge:
     """
@@ -133,11 +140,11 @@ class SystemBridge:
         try:
             result = subprocess.run(
                 ["vcgencmd", "measure_clock", "arm"],
-                capture_output=True, text=True, timeout=2,
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=2,
             )
             if result.returncode == 0:
-                # Output: "frequency(48)=1500000000"
-                hz = int(result.stdout.strip().split("=")[1])
+                # Output: b"frequency(48)=1500000000"
+                hz = int(result.stdout.rpartition(b"=")[2])
                 metrics["cpu_freq_mhz"] = round(hz / 1_000_000)
             else:
                 metrics["cpu_freq_mhz"] = None
@@ -171,13 +178,13 @@ class SystemBridge:
         try:
             result = subprocess.run(
                 ["vcgencmd", "get_throttled"],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 timeout=2,
             )
             if result.returncode == 0:
-                # Output: "throttled=0xe0008"
-                hex_str = result.stdout.strip().split("=")[1]
+                # Output: b"throttled=0xe0008"
+                hex_str = result.stdout.rpartition(b"=")[2].strip().decode("ascii")
                 flags = int(hex_str, 16)
                 metrics["throttle_hex"] = hex_str
                 metrics["throttle_flags"] = {
@@ -250,7 +257,6 @@ class SystemBridge:
     def _save_fan_curve_to_config(self, curve: Dict[str, float]):
         """Persist fan curve to config.yaml using targeted line replacement (preserves comments)."""
         try:
-            import re
             config_path = os.path.join(os.getcwd(), "config.yaml")
             with open(config_path) as f:
                 content = f.read()
@@ -259,13 +265,7 @@ class SystemBridge:
                 val = float(curve[key])
                 # Format as int if whole number, else float
                 val_str = str(int(val)) if val == int(val) else str(val)
-                content = re.sub(
-                    rf"^(\s*{key}:\s*)[\d.]+",
-                    rf"\g<1>{val_str}",
-                    content,
-                    count=1,
-                    flags=re.MULTILINE,
-                )
+                content = _FAN_TRIP_RES[key].sub(rf"\g<1>{val_str}", content, count=1)
 
             with open(config_path, "w") as f:
                 f.write(content)
@@ -4,21 +4,60 @@ Provides standardized MQTT client creation and configuration
 """
 
 import paho.mqtt.client as mqtt
+from paho.mqtt.packettypes import PacketTypes
+from paho.mqtt.properties import Properties
 from config.loader import ConfigLoader
 
+# How long the broker keeps a persistent MQTT v5 session after disconnect
+SESSION_EXPIRY_SECONDS = 24 * 3600
 
-def create_mqtt_client(config_loader: ConfigLoader) -> mqtt.Client:
+
+def create_mqtt_client(
+    config_loader: ConfigLoader,
+    client_id: str = "",
+    clean_session: bool = True,
+    protocol: int = mqtt.MQTTv311,
+) -> mqtt.Client:
     """
     Create and configure MQTT client with standard settings
 
     Args:
         config_loader: ConfigLoader instance to get MQTT configuration
+        client_id: Fixed client ID (required for persistent sessions)
+        clean_session: Set False with a client_id to keep subscriptions
+            across reconnects (check flags.session_present in on_connect)
+        protocol: mqtt.MQTTv311 (default) or mqtt.MQTTv5 for subscribe
+            options such as no_local / retain_handling
 
     Returns:
         Configured MQTT client instance
     """
     mqtt_config = config_loader.get_mqtt_config()
-    client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
+    persistent = bool(client_id) and not clean_session
+
+    if protocol == mqtt.MQTTv5:
+        client = mqtt.Client(
+            mqtt.CallbackAPIVersion.VERSION2, client_id=client_id, protocol=protocol
+        )
+        properties = None
+        if persistent:
+            # v5 replaces clean_session with clean_start + a session expiry
+            properties = Properties(PacketTypes.CONNECT)
+            properties.SessionExpiryInterval = SESSION_EXPIRY_SECONDS
+        client.connect(
+            mqtt_config.broker,
+            mqtt_config.port,
+            mqtt_config.keepalive,
+            clean_start=not persistent,
+            properties=properties,
+        )
+        return client
+
+    client = mqtt.Client(
+        mqtt.CallbackAPIVersion.VERSION2,
+        client_id=client_id,
+        clean_session=not persistent,
+    )
     client.connect(mqtt_config.broker, mqtt_config.port, mqtt_config.keepalive)
     return client
 
@@ -319,7 +319,8 @@ def get_ap_clients(ap_interface: str) -> List[Dict]:
     clients = []
     try:
         with open("/proc/net/arp", "r") as f:
-            for line in f.readlines()[1:]:  # skip header
+            next(f, None)  # skip header
+            for line in f:
                 parts = line.split()
                 if len(parts) >= 6 and parts[5] == ap_interface and parts[2] != "0x0":
                     clients.append({"ip": parts[0], "mac": parts[3]})
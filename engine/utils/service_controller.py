@@ -60,6 +60,7 @@ class ServiceController:
         self._bus = SystemBus()
         self._systemd = self._bus.get("org.freedesktop.systemd1")
         self._unit_proxy = None
+        self._unit_path: Optional[str] = None
         self._log_process: Optional[subprocess.Popen] = None
         self._log_thread: Optional[threading.Thread] = None
         self._log_running = False
@@ -67,11 +68,18 @@ class ServiceController:
     # ======== D-Bus unit proxy ========
 
     def _get_unit(self):
-        """Get or refresh the D-Bus proxy for this unit."""
+        """
+        Get or refresh the D-Bus proxy for this unit.
+
+        The proxy is kept across calls: building one costs an Introspect
+        round-trip, while the unit's object path never changes.
+        """
         try:
             # LoadUnit ensures the unit object exists on the bus even if inactive
             unit_path = self._systemd.LoadUnit(self._full_name)
-            self._unit_proxy = self._bus.get("org.freedesktop.systemd1", unit_path)
+            if self._unit_proxy is None or unit_path != self._unit_path:
+                self._unit_proxy = self._bus.get("org.freedesktop.systemd1", unit_path)
+                self._unit_path = unit_path
         except Exception as e:
             logger.error(f"[{self.unit_name}] Failed to get unit proxy: {e}")
             self._unit_proxy = None
@@ -314,8 +322,6 @@ class ServiceController:
                 ],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
-                text=True,
-                bufsize=1,
             )
             self._log_running = True
             self._log_thread = threading.Thread(
@@ -346,7 +352,13 @@ class ServiceController:
         logger.info(f"[{self.unit_name}] Log stream stopped")
 
     def _log_reader(self, callback: Callable[[dict], None]):
-        """Background thread reading journalctl JSON output."""
+        """
+        Background thread reading journalctl JSON output.
+
+        The pipe is read as bytes: json.loads() decodes UTF-8 itself, so
+        lines skip the text wrapper's separate decode pass (and a line with
+        invalid UTF-8 is dropped instead of ending the stream).
+        """
         try:
             for line in self._log_process.stdout:
                 if not self._log_running:
@@ -357,7 +369,7 @@ class ServiceController:
                 try:
                     entry = json.loads(line)
                     callback(entry)
-                except json.JSONDecodeError:
+                except ValueError:
                     continue
         except Exception as e:
             if self._log_running: